@@ -14,7 +14,11 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
-from skyfield.api import load, wgs84
+from skyfield.api import EarthSatellite, Loader, load, wgs84
+from skyfield.functions import rot_z
+from skyfield.sgp4lib import theta_GMST1982
+from sgp4.api import SatrecArray, jday
+from scipy.interpolate import CubicSpline
 import datetime
 from pathlib import Path
 import matplotlib.dates as mdates
@@ -41,6 +45,9 @@ ELEVATION_M = 32.0
 MIN_ELEVATION = 30.0  # High quality passes only
 HOURS_AHEAD = 48  # Analyze 48h window
 TOP_N_SATS = 10  # Pick the Top 10 best satellites
+TLE_MAX_AGE_DAYS = 1.0  # Re-download Celestrak TLEs once the cache is this old
+STEP_SECONDS = 10.0  # Time grid resolution for the batched propagation
+TRACK_SAMPLES = 50  # Points per pass in the winners' detailed tracks
 
 DATA_DIR = Path("../data")
 if not DATA_DIR.exists():
@@ -55,6 +62,12 @@ candidates["norad_cat_id"] = (
     pd.to_numeric(candidates["norad_cat_id"], errors="coerce").fillna(0).astype(int)
 )
 target_ids = set(candidates["norad_cat_id"].tolist())
+# First listing wins when a satellite appears more than once
+name_by_id = (
+    candidates.drop_duplicates("norad_cat_id")
+    .set_index("norad_cat_id")["amsat_name"]
+    .to_dict()
+)
 
 print(f"Candidate Pool: {len(target_ids)} satellites")
 
@@ -62,25 +75,51 @@ print(f"Candidate Pool: {len(target_ids)} satellites")
 # ## 2. Physics Engine (Skyfield)
 
 # %%
+ts = load.timescale()
+
+
+def load_target_tles(path, wanted_ids):
+    """Parse a TLE file, building satellites only for NORAD ids in wanted_ids."""
+    found = {}
+    name = None
+    with open(path) as f:
+        for line in f:
+            line = line.rstrip()
+            if not line.startswith("1 "):
+                name = line.strip() or None
+                continue
+            line2 = next(f, "").rstrip()
+            norad_field = line[2:7]
+            # Peek at the NORAD id before paying for SGP4 initialisation
+            if norad_field.strip().isdigit() and int(norad_field) in wanted_ids:
+                found[int(norad_field)] = EarthSatellite(line, line2, name, ts)
+            name = None
+    return found
+
+
 # Load TLEs from multiple groups to increase coverage
+# Cached files are reused until they are TLE_MAX_AGE_DAYS old
 TLE_GROUPS = ["active", "amateur"]
+tle_loader = Loader(str(DATA_DIR))
 by_id = {}
 for group in TLE_GROUPS:
     url = f"https://celestrak.org/NORAD/elements/gp.php?GROUP={group}&FORMAT=tle"
-    filename = DATA_DIR / f"celestrak_{group}.txt"
+    filename = f"celestrak_{group}.txt"
+    cached = (DATA_DIR / filename).exists()
     try:
-        satellites = load.tle_file(url, filename=str(filename))
-        for sat in satellites:
-            by_id[sat.model.satnum] = sat
+        if not cached or tle_loader.days_old(filename) >= TLE_MAX_AGE_DAYS:
+            tle_loader.download(url, filename=filename)
     except Exception as e:
         print(f"Warning: Failed to load TLE group {group}: {e}")
+        if not cached:
+            continue
+        # Fall back to the stale cache rather than dropping the whole group
+    by_id.update(load_target_tles(DATA_DIR / filename, target_ids))
 
 my_sats = [by_id[nid] for nid in target_ids if nid in by_id]
 
 # Setup Observer
-ts = load.timescale()
 t0 = ts.now()
-t1 = ts.from_datetime(t0.utc_datetime() + datetime.timedelta(hours=HOURS_AHEAD))
 ground_station = wgs84.latlon(LATITUDE, LONGITUDE, elevation_m=ELEVATION_M)
 
 print(
@@ -89,127 +128,175 @@ print(
 
 # %% [markdown]
 # ## 3. Scoring the Satellites
-# We simulate passes for *all* candidates first, then aggregate scores.
+# We propagate *all* candidates in one batched SGP4 call on a dense time grid,
+# convert to topocentric altitude, then aggregate scores per satellite.
 
 # %%
-satellite_scores = []
-all_passes = []
+n_steps = int(HOURS_AHEAD * 3600 / STEP_SECONDS) + 1
+offsets_days = np.arange(n_steps) * STEP_SECONDS / 86400.0
+t_grid = ts.tt_jd(t0.tt + offsets_days)
+
+start_utc = t0.utc_datetime()
+jd0, fr0 = jday(
+    start_utc.year,
+    start_utc.month,
+    start_utc.day,
+    start_utc.hour,
+    start_utc.minute,
+    start_utc.second + start_utc.microsecond / 1e6,
+)
+jd = np.full(n_steps, jd0)
+fr = fr0 + offsets_days
+
+# Positions for every satellite at every grid step: (N_sats, N_times, 3) km, TEME
+sat_array = SatrecArray([sat.model for sat in my_sats])
+sgp4_errors, r_teme, _ = sat_array.sgp4(jd, fr)
+
+# TEME -> ITRF is a rotation about z by GMST; one (3, 3, N_times) stack serves all
+theta, _ = theta_GMST1982(t_grid.whole, t_grid.ut1_fraction)
+teme_to_itrf = rot_z(-theta)
+
+# Observer position and local east/north/up unit vectors in ITRF
+station_xyz = ground_station.itrs_xyz.km
+lat_rad, lon_rad = np.radians(LATITUDE), np.radians(LONGITUDE)
+east = np.array([-np.sin(lon_rad), np.cos(lon_rad), 0.0])
+north = np.array(
+    [
+        -np.sin(lat_rad) * np.cos(lon_rad),
+        -np.sin(lat_rad) * np.sin(lon_rad),
+        np.cos(lat_rad),
+    ]
+)
+up = np.array(
+    [
+        np.cos(lat_rad) * np.cos(lon_rad),
+        np.cos(lat_rad) * np.sin(lon_rad),
+        np.sin(lat_rad),
+    ]
+)
 
-for sat in my_sats:
-    # Find events
-    times, events = sat.find_events(
-        ground_station, t0, t1, altitude_degrees=MIN_ELEVATION
-    )
+# Station-relative ITRF vectors for every satellite and step: (N_sats, N_times, 3)
+r_rel = np.einsum("ijt,ntj->nti", teme_to_itrf, r_teme) - station_xyz
+# float32 is ample for degree-level scans and halves the matrices' footprint
+alt = np.degrees(np.arcsin(r_rel @ up / np.linalg.norm(r_rel, axis=-1)))
+alt = alt.astype(np.float32)
+az = (np.degrees(np.arctan2(r_rel @ east, r_rel @ north)) % 360.0).astype(np.float32)
+alt[sgp4_errors != 0] = np.nan  # Decayed / invalid propagation never counts
 
-    sat_passes = []
-    total_duration = 0.0
-    pass_count = 0
-    max_el_overall = 0.0
-
-    current_rise = None
-    for ti, event in zip(times, events):
-        if event == 0:  # Rise
-            current_rise = ti
-        elif event == 2:  # Set
-            if current_rise is not None:
-                start_dt = current_rise.utc_datetime()
-                end_dt = ti.utc_datetime()
-                duration = (end_dt - start_dt).total_seconds() / 60.0
-
-                # Rough max el check (midpoint)
-                mid_time = ts.from_datetime(
-                    start_dt + datetime.timedelta(minutes=duration / 2)
-                )
-                alt, _, _ = (sat - ground_station).at(mid_time).altaz()
-                peak_el = alt.degrees
-
-                if peak_el > max_el_overall:
-                    max_el_overall = peak_el
-
-                sat_passes.append(
-                    {
-                        "start": start_dt,
-                        "end": end_dt,
-                        "duration": duration,
-                        "peak_el": peak_el,
-                    }
-                )
-                total_duration += duration
-                pass_count += 1
-            current_rise = None
-
-    if pass_count > 0:
-        name = candidates[candidates["norad_cat_id"] == sat.model.satnum].iloc[0][
-            "amsat_name"
-        ]
-        satellite_scores.append(
-            {
-                "name": name,
-                "norad_id": sat.model.satnum,
-                "total_duration": total_duration,
-                "pass_count": pass_count,
-                "max_el": max_el_overall,
-                "obj": sat,  # Keep object for detailed plotting later
-                "passes": sat_passes,
-            }
-        )
+
+def find_passes(alt, threshold):
+    """Locate every complete pass in the (N_sats, N_times) altitude matrix.
+
+    A pass rises between steps ``rise`` and ``rise + 1`` and sets between
+    ``set`` and ``set + 1``. Returns flat ``(sat_idx, rise_idx, set_idx,
+    peak_el)`` arrays ordered by satellite, then time.
+    """
+    n_times = alt.shape[1]
+
+    # +1 / -1 where a row steps above / below the threshold (NaN counts as below)
+    changes = np.diff((alt > threshold).astype(np.int8), axis=1)
+    rise_sat, rise_idx = np.nonzero(changes == 1)
+    set_sat, set_idx = np.nonzero(changes == -1)
+
+    # Pair each rise with the next set of the same satellite via flat keys;
+    # rises still above at the end and sets already above at t0 drop out
+    set_keys = set_sat * n_times + set_idx
+    nxt = np.searchsorted(set_keys, rise_sat * n_times + rise_idx)
+    has_set = nxt < len(set_keys)
+    has_set[has_set] = set_sat[nxt[has_set]] == rise_sat[has_set]
+    sat_idx, rise_idx = rise_sat[has_set], rise_idx[has_set]
+    set_idx = set_idx[nxt[has_set]]
+
+    # Peak of the in-pass samples [rise + 1, set] of each pass
+    bounds = np.column_stack([rise_idx + 1, set_idx + 1]) + (sat_idx * n_times)[:, None]
+    peak_el = np.fmax.reduceat(alt.ravel(), bounds.ravel())[::2]
+
+    return sat_idx, rise_idx, set_idx, peak_el
+
+
+def crossing_index(rows, k):
+    """Fractional grid index where alt[rows] crosses MIN_ELEVATION in [k, k+1]."""
+    a = alt[rows, k] - MIN_ELEVATION
+    b = alt[rows, k + 1] - MIN_ELEVATION
+    return k + np.divide(a, a - b, out=np.zeros_like(a), where=a != b)
+
+
+def grid_datetime(index):
+    """UTC datetime of a (fractional) grid index."""
+    return start_utc + datetime.timedelta(seconds=index * STEP_SECONDS)
+
+
+# %%
+pass_sat, pass_rise, pass_set, pass_peak = find_passes(alt, MIN_ELEVATION)
+pass_bounds = np.searchsorted(pass_sat, np.arange(len(my_sats) + 1))
+rise_at = crossing_index(pass_sat, pass_rise)
+set_at = crossing_index(pass_sat, pass_set)
+pass_duration = (set_at - rise_at) * STEP_SECONDS / 60.0
+
+# Per-satellite aggregates, one slot per row of alt/az
+n_sats = len(my_sats)
+pass_count = np.bincount(pass_sat, minlength=n_sats)
+total_duration = np.bincount(pass_sat, weights=pass_duration, minlength=n_sats)
+max_el = np.zeros(n_sats)
+np.maximum.at(max_el, pass_sat, pass_peak)
+
+norad_ids = [sat.model.satnum for sat in my_sats]
+satellite_scores = pd.DataFrame(
+    {
+        "name": [name_by_id[nid] for nid in norad_ids],
+        "norad_id": norad_ids,
+        "total_duration": total_duration,
+        "pass_count": pass_count,
+        "max_el": max_el,
+        "row": np.arange(n_sats),  # Row in alt/az, kept for detailed plotting later
+    }
+)
 
 # Sort by Total Duration
-satellite_scores.sort(key=lambda x: x["total_duration"], reverse=True)
-top_sats = satellite_scores[:TOP_N_SATS]
+order = np.argsort(-total_duration, kind="stable")
+satellite_scores = satellite_scores.iloc[order]
+satellite_scores = satellite_scores[satellite_scores["pass_count"] > 0]
+top_sats = satellite_scores.head(TOP_N_SATS)
 
 # %% [markdown]
 # ## 3.1 The Winners (Top 5)
 # These are the satellites you should focus on.
 
 # %%
-df_scores = pd.DataFrame(top_sats).drop(columns=["obj", "passes"])
 print("Top Satellites by Total Observable Time:")
 print(
-    df_scores[["name", "pass_count", "total_duration", "max_el"]].to_string(index=False)
+    top_sats[["name", "pass_count", "total_duration", "max_el"]].to_string(index=False)
 )
 
 # %% [markdown]
 # ## 4. Detailed Calculation for Visualization
-# Now we generate the high-res tracks ONLY for the winners.
+# The winners' tracks are slices of the alt/az matrices we already have,
+# upsampled with a cubic spline (no second round of propagation).
 
 # %%
 tracks = []
 
-for sat_data in top_sats:
-    sat = sat_data["obj"]
-    # Re-run precise calculation for plotting
-    times, events = sat.find_events(
-        ground_station, t0, t1, altitude_degrees=MIN_ELEVATION
-    )
-
-    current_rise = None
-    for ti, event in zip(times, events):
-        if event == 0:
-            current_rise = ti
-        elif event == 2:
-            if current_rise is not None:
-                # High-res sampling
-                num_points = 50
-                t_samples = ts.linspace(current_rise, ti, num_points)
-                topocentric = (sat - ground_station).at(t_samples)
-                alt, az, _ = topocentric.altaz()
-
-                start_dt = current_rise.utc_datetime()
-                duration = (ti.utc_datetime() - start_dt).total_seconds() / 60
-
-                tracks.append(
-                    {
-                        "name": sat_data["name"],
-                        "times": t_samples.utc_datetime(),
-                        "azimuth": az.degrees,
-                        "elevation": alt.degrees,
-                        "max_el": alt.degrees.max(),
-                        "start_time": start_dt,
-                        "duration_min": duration,
-                    }
-                )
-            current_rise = None
+for sat_data in top_sats.itertuples():
+    i = sat_data.row
+    for p in range(pass_bounds[i], pass_bounds[i + 1]):
+        # Grid samples bracketing the pass, resampled between the crossings
+        k = np.arange(pass_rise[p], pass_set[p] + 2)
+        k_fine = np.linspace(rise_at[p], set_at[p], TRACK_SAMPLES)
+        sample_t = ts.tt_jd(t0.tt + k_fine * STEP_SECONDS / 86400.0)
+        elevation = CubicSpline(k, alt[i, k])(k_fine)
+        azimuth = CubicSpline(k, np.unwrap(az[i, k], period=360.0))(k_fine) % 360.0
+
+        tracks.append(
+            {
+                "name": sat_data.name,
+                "times": sample_t.utc_datetime(),
+                "azimuth": azimuth,
+                "elevation": elevation,
+                "max_el": elevation.max(),
+                "start_time": grid_datetime(rise_at[p]),
+                "duration_min": pass_duration[p],
+            }
+        )
 
 # %% [markdown]
 # ## 5. Skyplot: The Winners' Paths
@@ -227,7 +314,7 @@ ax.set_yticklabels(["30°", "45°", "60°", "Zenith"], color="#666666")
 ax.grid(True, color="#DDDDDD", linestyle="--", alpha=0.7)
 
 # Color by Satellite Name
-unique_names = [s["name"] for s in top_sats]
+unique_names = top_sats["name"].tolist()
 palette = sns.color_palette("bright", len(unique_names))
 color_map = {name: color for name, color in zip(unique_names, palette)}
 
@@ -43,12 +43,22 @@ if not FIG_DIR.exists():
     FIG_DIR = Path("docs/figures")
 
 # Load AMSAT (Frequencies)
-df_amsat = pd.read_csv(DATA_DIR / "amsat-active-frequencies.csv")
+# Only parse the columns the funnel uses
+df_amsat = pd.read_csv(
+    DATA_DIR / "amsat-active-frequencies.csv",
+    usecols=["name", "satnogs_id", "downlink", "mode", "callsign"],
+    engine="c",
+)
 print(f"Loaded AMSAT List: {len(df_amsat)} rows")
 
 # Load SatNOGS (Status)
-# SatNOGS CSV can have complex quoting, pandas handles it well usually
-df_satnogs = pd.read_csv(DATA_DIR / "satnogs.csv")
+# SatNOGS CSV can have complex quoting, pandas handles it well usually.
+# The wide free-text columns are skipped entirely.
+df_satnogs = pd.read_csv(
+    DATA_DIR / "satnogs.csv",
+    usecols=["sat_id", "status", "norad_cat_id"],
+    engine="c",
+)
 print(f"Loaded SatNOGS DB: {len(df_satnogs)} rows")
 
 # Load satnogsdecoders support list
@@ -109,23 +119,17 @@ except ImportError:
 
 # %%
 # Prepare AMSAT
-df_amsat_clean = df_amsat.dropna(subset=["satnogs_id"]).copy()
+merged = df_amsat.dropna(subset=["satnogs_id"]).copy()
 # Rename for clarity
-df_amsat_clean.rename(columns={"name": "amsat_name"}, inplace=True)
-
-# Prepare SatNOGS
-# We only care about status and maybe image/names
-df_satnogs_clean = df_satnogs[["sat_id", "status", "name", "norad_cat_id"]].copy()
-df_satnogs_clean.rename(columns={"name": "satnogs_name"}, inplace=True)
-
-# Merge
-merged = pd.merge(
-    df_amsat_clean,
-    df_satnogs_clean,
-    left_on="satnogs_id",
-    right_on="sat_id",
-    how="left",
-)
+merged.rename(columns={"name": "amsat_name"}, inplace=True)
+
+# Prepare SatNOGS as a lookup table keyed by sat_id
+# We only care about status and the NORAD id
+satnogs_by_id = df_satnogs.drop_duplicates("sat_id").set_index("sat_id")
+
+# Left join: look each column up by satnogs_id instead of a full merge
+for col in ["status", "norad_cat_id"]:
+    merged[col] = merged["satnogs_id"].map(satnogs_by_id[col])
 
 # Fill missing status with 'unknown' (since AMSAT list implies active, but we prefer SatNOGS confirmation)
 merged["status"] = merged["status"].fillna("unknown")
@@ -161,24 +165,18 @@ active_supported = active_sats[active_sats["supported"]].copy()
 print(f"Satellites Active & Supported: {len(active_supported)}")
 
 
-# 3. Frequency Parsing
-def parse_frequencies(downlink_str):
-    if pd.isna(downlink_str):
-        return []
-    matches = re.findall(r"(\d{3}\.\d+)", str(downlink_str))
-    return [float(m) for m in matches]
-
-
-def get_primary_freq(freq_list):
-    for f in freq_list:
-        if 430.0 <= f <= 440.0:
-            return f
-    return np.nan
+# 3. Frequency Parsing: first 70cm (430-440 MHz) downlink listed per satellite
+# MHz values such as "435.600" anywhere in the downlink text
+FREQ_PATTERN = re.compile(r"(?P<freq>\d{3}\.\d+)")
 
-
-# Apply frequency parsing to ALL active satellites first
-active_sats["all_freqs"] = active_sats["downlink"].apply(parse_frequencies)
-active_sats["primary_freq"] = active_sats["all_freqs"].apply(get_primary_freq)
+downlink_freqs = (
+    active_sats["downlink"]
+    .astype("string")
+    .str.extractall(FREQ_PATTERN)["freq"]
+    .astype(float)
+)
+in_70cm = downlink_freqs[downlink_freqs.between(430.0, 440.0)]
+active_sats["primary_freq"] = in_70cm.groupby(level=0).first()
 
 # 4. Band Filter (433-438 MHz) - THE FLEET COHORT
 fleet_in_band = active_sats[
@@ -192,53 +190,53 @@ print(f"Total Active Satellites in 70cm Band: {len(fleet_in_band)}")
 
 
 # %%
-def normalize_mode(mode_str):
-    if pd.isna(mode_str) or mode_str == "":
-        return "Unknown", "Unknown"
-
-    m = str(mode_str).upper()
-
-    # Modulation Class Extraction (Robust)
-    # We look for common standards
-    mod_classes = ["GMSK", "GFSK", "MSK", "FSK", "AFSK", "BPSK", "QPSK", "CW", "LORA"]
-    found_mods = []
-    for mod in mod_classes:
-        if re.search(rf"\b{mod}\b", m):
-            found_mods.append(mod)
-
-    mod = "/".join(found_mods) if found_mods else "Other"
-
-    # Baud Rate Extraction (Robust)
-    rate = "Other"
-    # Matches "9600bps", "9600 bps", "9k6", etc.
-    baud_match = re.search(r"(\d+(?:\.\d+)?(?:k\d*)?)\s*bps", m, re.I)
-    if not baud_match:
-        # Try generic number match if followed by bps or common baud indicators
-        baud_match = re.search(r"(\d+(?:k\d*)?)(?=\s*(?:bps|baud|baudrate))", m, re.I)
-
-    if baud_match:
-        raw = baud_match.group(1).lower()
-        if "k" in raw:
-            parts = raw.split("k")
-            try:
-                base = float(parts[0]) if parts[0] else 1.0
-                dec = float("0." + parts[1]) if len(parts) > 1 and parts[1] else 0.0
-                rate = str(int((base + dec) * 1000))
-            except ValueError:
-                rate = "Other"
-        else:
-            try:
-                rate = str(int(float(raw)))
-            except ValueError:
-                rate = "Other"
-    elif "9K6" in m:
-        rate = "9600"
-    elif "1K2" in m:
-        rate = "1200"
-    elif "4K8" in m:
-        rate = "4800"
-
-    return rate, mod
+# Modulation classes we look for, matched as whole words on the upper-cased mode
+MOD_CLASSES = ["GMSK", "GFSK", "MSK", "FSK", "AFSK", "BPSK", "QPSK", "CW", "LORA"]
+MOD_PATTERNS = {mod: re.compile(rf"\b{mod}\b") for mod in MOD_CLASSES}
+
+# Matches "9600bps", "9600 bps", "9k6 bps", "9.6k bps", ...
+BAUD_BPS_PATTERN = re.compile(r"(?P<base>\d+(?:\.\d+)?)(?:K(?P<dec>\d*))?\s*BPS")
+# Generic number followed by a baud indicator, e.g. "1200 baud"
+BAUD_GENERIC_PATTERN = re.compile(
+    r"(?P<base>\d+)(?:K(?P<dec>\d*))?(?=\s*(?:BPS|BAUD|BAUDRATE))"
+)
+# Bare shorthand with no unit, e.g. "9K6 GMSK"
+BAUD_SHORTHAND = {"9K6": "9600", "1K2": "1200", "4K8": "4800"}
+
+
+def normalize_modes(modes):
+    """Classify raw mode strings into (baud, modulation) columns, vectorized."""
+    m = modes.astype("string").str.upper()
+    missing = (m.isna() | (m == "")).to_numpy()
+    m = m.fillna("")
+
+    # Modulation Class Extraction: "/"-joined list of every class found
+    modulation = pd.Series("", index=m.index)
+    for mod, pattern in MOD_PATTERNS.items():
+        modulation += np.where(m.str.contains(pattern), mod + "/", "")
+    modulation = modulation.str.rstrip("/").replace("", "Other")
+
+    # Baud Rate Extraction: "<base>[k<dec>]" -> integer bps
+    raw = m.str.extract(BAUD_BPS_PATTERN)
+    raw = raw.where(raw["base"].notna(), m.str.extract(BAUD_GENERIC_PATTERN))
+    base = raw["base"].astype(float)
+    kilo = raw["dec"].notna()
+    dec = pd.to_numeric("0." + raw["dec"].fillna("0"))
+    rate = pd.Series(np.trunc(np.where(kilo, (base + dec) * 1000, base)), index=m.index)
+    shorthand = np.select(
+        [m.str.contains(key, regex=False) for key in BAUD_SHORTHAND],
+        list(BAUD_SHORTHAND.values()),
+        "Other",
+    )
+    baud = np.where(rate.isna(), shorthand, rate.astype("Int64").astype(str))
+
+    return pd.DataFrame(
+        {
+            "baud": np.where(missing, "Unknown", baud),
+            "modulation": np.where(missing, "Unknown", modulation),
+        },
+        index=modes.index,
+    )
 
 
 # %% [markdown]
@@ -247,9 +245,7 @@ def normalize_mode(mode_str):
 
 # %%
 # Normalize modes for the entire fleet
-fleet_in_band[["baud", "modulation"]] = fleet_in_band["mode"].apply(
-    lambda x: pd.Series(normalize_mode(x))
-)
+fleet_in_band[["baud", "modulation"]] = normalize_modes(fleet_in_band["mode"])
 fleet_in_band["combined_mode"] = (
     fleet_in_band["baud"] + " " + fleet_in_band["modulation"]
 )
@@ -310,7 +306,7 @@ cohort = target_band[target_band["combined_mode"].isin(target_mods)].sort_values
 )
 
 # Prioritize those with SatNOGS status 'alive' over 'unknown'
-cohort["status_priority"] = cohort["status"].apply(lambda x: 1 if x == "alive" else 2)
+cohort["status_priority"] = cohort["status"].map({"alive": 1}).fillna(2).astype("int8")
 cohort = cohort.sort_values(["status_priority", "primary_freq"])
 
 print(f"Golden Cohort Size: {len(cohort)}")
@@ -14,7 +14,8 @@
 # %%
 import ipywidgets as widgets
 from IPython.display import display
-import json
+import orjson
+import os
 from pathlib import Path
 from datetime import datetime
 import textwrap
@@ -43,11 +44,12 @@ def load_frames(norad_id, filename):
     frames = []
     if not filepath.exists():
         return []
-    with open(filepath, "r") as fh:
+    # orjson parses the raw line bytes, no text decode needed
+    with open(filepath, "rb") as fh:
         for line in fh:
             try:
-                frames.append(json.loads(line))
-            except:
+                frames.append(orjson.loads(line))
+            except orjson.JSONDecodeError:
                 continue
     return frames
 
@@ -118,6 +120,8 @@ class TelemetryInspector:
 
         # State
         self.frames = []
+        # Day listings per satellite, cleared by the refresh button
+        self._days_cache: dict[str, list[str]] = {}
         self.current_norad = self.sats[0] if self.sats else None
 
         # --- UI Components ---
@@ -147,6 +151,9 @@ class TelemetryInspector:
         self.btn_next = widgets.Button(
             description=">", layout=widgets.Layout(width="40px")
         )
+        self.btn_refresh = widgets.Button(
+            description="Refresh", layout=widgets.Layout(width="80px")
+        )
 
         # 2. Panels (HTML Widgets)
         common_layout = widgets.Layout(
@@ -171,6 +178,7 @@ class TelemetryInspector:
         self.frame_slider.observe(self._on_frame_change, names="value")
         self.btn_prev.on_click(self._on_prev)
         self.btn_next.on_click(self._on_next)
+        self.btn_refresh.on_click(self._on_refresh)
 
         # --- Initialization ---
         if self.current_norad:
@@ -182,10 +190,18 @@ class TelemetryInspector:
         return sorted([d.name for d in RAW_DIR.iterdir() if d.is_dir()])
 
     def _get_available_days(self, norad_id):
-        sat_dir = RAW_DIR / str(norad_id)
+        norad_id = str(norad_id)
+        if norad_id in self._days_cache:
+            return self._days_cache[norad_id]
+
+        sat_dir = RAW_DIR / norad_id
         if not sat_dir.exists():
             return []
-        return sorted([f.name for f in sat_dir.glob("*.jsonl")])
+        # scandir yields names without building a Path per entry
+        with os.scandir(sat_dir) as entries:
+            days = sorted(e.name for e in entries if e.name.endswith(".jsonl"))
+        self._days_cache[norad_id] = days
+        return days
 
     def _load_days(self, norad_id):
         days = self._get_available_days(norad_id)
@@ -314,9 +330,17 @@ class TelemetryInspector:
         if self.frame_slider.value < self.frame_slider.max:
             self.frame_slider.value += 1
 
+    def _on_refresh(self, _):
+        # Pick up files fetched since the listings were cached
+        self._days_cache.clear()
+        if self.current_norad:
+            self._load_days(self.current_norad)
+
     def show(self):
         # Layout Composition
-        controls_top = widgets.HBox([self.sat_dropdown, self.day_dropdown])
+        controls_top = widgets.HBox(
+            [self.sat_dropdown, self.day_dropdown, self.btn_refresh]
+        )
         controls_nav = widgets.HBox([self.btn_prev, self.frame_slider, self.btn_next])
 
         panels = widgets.HBox([self.panel_raw, self.panel_struct, self.panel_telem])
@@ -23,6 +23,7 @@ import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 import seaborn as sns
 from pathlib import Path
+from scipy.stats import gaussian_kde
 from sklearn.preprocessing import StandardScaler
 from sklearn.decomposition import PCA
 from sklearn.ensemble import IsolationForest
@@ -60,6 +61,17 @@ ML_FEATURES = [
     "temp_panel_z",
 ]
 
+# Telemetry columns are cast to float32 after loading: the sensors carry far
+# less precision than that, and it halves the bytes every downstream pass touches
+TELEMETRY_DTYPES = {
+    "batt_voltage": "float32",
+    "batt_current": "float32",
+    "temp_batt_a": "float32",
+    "temp_batt_b": "float32",
+    "temp_panel_z": "float32",
+    "temp_obc": "float32",
+}
+
 # --- Plot Style ---
 plt.style.use("ggplot")
 sns.set_theme(
@@ -83,6 +95,21 @@ def save_fig(fig, name):
     print(f"  📎 Saved: {path}")
 
 
+def subsampled_kde(values, grid, max_samples=5000, seed=0):
+    """Gaussian KDE fitted on at most max_samples finite values, evaluated on grid.
+
+    Returns None when there is nothing to fit (fewer than two finite values,
+    or all equal), where gaussian_kde would raise on a singular covariance.
+    """
+    values = values[np.isfinite(values)]
+    if len(values) > max_samples:
+        rng = np.random.default_rng(seed)
+        values = rng.choice(values, size=max_samples, replace=False)
+    if len(values) < 2 or np.ptp(values) == 0:
+        return None
+    return gaussian_kde(values)(grid)
+
+
 # %% [markdown]
 # ---
 # ## Part 1: Pipeline Sanity Check
@@ -94,14 +121,18 @@ def save_fig(fig, name):
 # - Are the deduplication decisions sound?
 
 # %%
-# Load both datasets
-df_interim = pd.read_csv(INTERIM_PATH)
-df_interim["timestamp"] = pd.to_datetime(df_interim["timestamp"])
-df_interim = df_interim.sort_values("timestamp").reset_index(drop=True)
-
-df = pd.read_csv(PROCESSED_PATH)
-df["timestamp"] = pd.to_datetime(df["timestamp"])
-df = df.sort_values("timestamp").reset_index(drop=True)
+# Load both datasets (Arrow's CSV reader parses the timestamps in the same pass)
+df_interim = pd.read_csv(INTERIM_PATH, engine="pyarrow", parse_dates=["timestamp"])
+if not df_interim["timestamp"].is_monotonic_increasing:
+    df_interim = df_interim.sort_values("timestamp").reset_index(drop=True)
+
+df = pd.read_csv(PROCESSED_PATH, engine="pyarrow", parse_dates=["timestamp"])
+# Cast after the read: dtype= on the Arrow reader re-casts every column and
+# fails on any integer column that has empty fields
+df = df.astype({c: t for c, t in TELEMETRY_DTYPES.items() if c in df.columns})
+# The pipeline writes both files in time order, so the sort is usually a no-op
+if not df["timestamp"].is_monotonic_increasing:
+    df = df.sort_values("timestamp").reset_index(drop=True)
 
 print("=" * 60)
 print("PIPELINE OVERVIEW")
@@ -269,9 +300,11 @@ else:
 
 # Zero-variance features
 print("\n--- Constant/Zero-Variance Features ---")
-for col in df.select_dtypes(include=[np.number]).columns:
-    if df[col].nunique() <= 1:
-        print(f"  ⚠️  {col}: constant value = {df[col].iloc[0]}")
+numeric = df.select_dtypes(include=[np.number])
+col_min, col_max = numeric.min(), numeric.max()
+# min == max means at most one distinct value; all-NaN columns have neither
+for col in numeric.columns[(col_min == col_max) | col_min.isna()]:
+    print(f"  ⚠️  {col}: constant value = {df[col].iloc[0]}")
 
 # Monthly data volume
 df["month"] = df["timestamp"].dt.to_period("M")
@@ -293,16 +326,17 @@ fig.suptitle(
 for i, feat in enumerate(ML_FEATURES):
     ax = axes.flat[i]
     col = df[feat]
-
-    # Histogram + KDE
-    sns.histplot(
-        col,
-        bins=60,
-        kde=True,
-        ax=ax,
-        color=sns.color_palette("viridis", 5)[i],
-        alpha=0.7,
-    )
+    color = sns.color_palette("viridis", 5)[i]
+
+    # Histogram + KDE (fitted on a subsample, scaled to the count axis)
+    sns.histplot(col, bins=60, ax=ax, color=color, alpha=0.7)
+    values = col.to_numpy()
+    lo, hi = np.nanmin(values), np.nanmax(values)
+    grid = np.linspace(lo, hi, 256)
+    bin_width = (hi - lo) / 60
+    density = subsampled_kde(values, grid)
+    if density is not None:
+        ax.plot(grid, density * col.count() * bin_width, color=color)
 
     # Mark the 1st/99th percentile range
     p1, p99 = col.quantile(0.01), col.quantile(0.99)
@@ -378,8 +412,13 @@ print("     These will be used as 'real anomaly candidates' for validation.")
 # 🎯 **Dashboard candidate:** Eclipse/Sunlight state indicator
 
 # %%
+# Day/night masks, computed once and reused by every plot below
+panel_z = df["temp_panel_z"].to_numpy()
+sunlit = panel_z > 15
+eclipsed = panel_z <= 15
+
 # 3.1 Eclipse vs Sunlight physics scatter
-plot_df = df[~((df["batt_voltage"] > 5) | (df["batt_current"].abs() > 1.0))]
+plot_df = df[~extreme_mask]
 
 fig, ax = plt.subplots(figsize=(10, 7))
 scatter = ax.scatter(
@@ -409,8 +448,8 @@ save_fig(fig, "eclipse_scatter")
 plt.show(block=False)
 
 # Print summary
-sunlight = df[df["temp_panel_z"] > 15]
-eclipse = df[df["temp_panel_z"] <= 15]
+sunlight = df[sunlit]
+eclipse = df[eclipsed]
 print(f"Sunlight frames: {len(sunlight)} ({len(sunlight) / len(df) * 100:.1f}%)")
 print(f"  Avg current: {sunlight['batt_current'].mean():+.3f} A (charging)")
 print(f"  Avg voltage: {sunlight['batt_voltage'].mean():.3f} V")
@@ -421,7 +460,16 @@ print(f"  Avg voltage: {eclipse['batt_voltage'].mean():.3f} V")
 # %%
 # 3.2 Correlation heatmap
 fig, ax = plt.subplots(figsize=(8, 6))
-corr = df[ML_FEATURES].corr()
+# One GEMM on standardised columns instead of pandas' pairwise loop. That is
+# only the same number when nothing is missing: corr() drops NaNs per pair,
+# so any gap falls back to it.
+if df[ML_FEATURES].notna().all().all():
+    Z = df[ML_FEATURES].to_numpy(dtype=np.float32, copy=True)
+    Z -= Z.mean(axis=0)
+    Z /= Z.std(axis=0)
+    corr = pd.DataFrame((Z.T @ Z) / len(Z), index=ML_FEATURES, columns=ML_FEATURES)
+else:
+    corr = df[ML_FEATURES].corr()
 mask = np.triu(np.ones_like(corr, dtype=bool))
 sns.heatmap(
     corr,
@@ -442,22 +490,66 @@ plt.show()
 
 # %%
 # 3.3 Pairplot with Day/Night coloring
-df_pair = df[ML_FEATURES].copy()
-df_pair["State"] = np.where(df["temp_panel_z"] > 15, "Sunlight", "Eclipse")
-
-pair_fig = sns.pairplot(
-    df_pair,
-    hue="State",
-    diag_kind="kde",
-    corner=True,
-    palette={"Sunlight": "#f0a500", "Eclipse": "#3a0ca3"},
-    plot_kws={"alpha": 0.15, "s": 6, "edgecolor": "none"},
-    diag_kws={"alpha": 0.6},
-)
-pair_fig.fig.suptitle(
+# Off-diagonal panels are hexbin densities, one layer per state in that
+# state's colour (not a marker per frame); the diagonal keeps the per-state
+# KDEs on a fixed 256-point grid.
+pair_values = df[ML_FEATURES].to_numpy()
+pair_states = {"Sunlight": (sunlit, "#f0a500"), "Eclipse": (eclipsed, "#3a0ca3")}
+n_feat = len(ML_FEATURES)
+
+pair_fig, axes = plt.subplots(n_feat, n_feat, figsize=(14, 14))
+for i in range(n_feat):
+    for j in range(n_feat):
+        ax = axes[i, j]
+        if j > i:
+            ax.set_visible(False)
+            continue
+
+        x = pair_values[:, j]
+        if i == j:
+            grid = np.linspace(np.nanmin(x), np.nanmax(x), 256)
+            for state, (mask, color) in pair_states.items():
+                density = subsampled_kde(x[mask], grid)
+                if density is not None:
+                    ax.fill_between(grid, density, alpha=0.6, color=color, label=state)
+            ax.set_yticks([])
+        else:
+            y = pair_values[:, i]
+            finite = np.isfinite(x) & np.isfinite(y)
+            # Shared extent so both states' hexagons land on the same grid
+            extent = (
+                x[finite].min(),
+                x[finite].max(),
+                y[finite].min(),
+                y[finite].max(),
+            )
+            for mask, color in pair_states.values():
+                sel = finite & mask
+                if sel.any():
+                    ax.hexbin(
+                        x[sel],
+                        y[sel],
+                        gridsize=60,
+                        extent=extent,
+                        cmap=sns.light_palette(color, as_cmap=True),
+                        bins="log",
+                        mincnt=1,
+                        alpha=0.6,
+                    )
+
+        if i == n_feat - 1:
+            ax.set_xlabel(ML_FEATURES[j])
+        else:
+            ax.set_xticklabels([])
+        if j == 0 and i > 0:
+            ax.set_ylabel(ML_FEATURES[i])
+
+axes[0, 0].legend(loc="upper right", fontsize=9)
+pair_fig.suptitle(
     "Feature Pairplot — Day/Night Operational States", y=1.02, fontweight="bold"
 )
-save_fig(pair_fig.fig, "pairplot_day_night")
+plt.tight_layout()
+save_fig(pair_fig, "pairplot_day_night")
 plt.show()
 
 # %% [markdown]
@@ -469,19 +561,25 @@ plt.show()
 # 🎯 **Dashboard candidates:** Pass timeline, long-term health trend, coverage carpet
 
 # %%
-# Compute time gaps and pass IDs
-df["time_diff_sec"] = df["timestamp"].diff().dt.total_seconds()
-df["pass_id"] = (df["time_diff_sec"] > 120).cumsum()  # 2-minute gap = new pass
+# Compute time gaps and pass IDs on the raw int64 nanosecond stamps
+ts_ns = df["timestamp"].to_numpy(dtype="datetime64[ns]").view(np.int64)
+diff_ns = np.zeros_like(ts_ns)
+np.subtract(ts_ns[1:], ts_ns[:-1], out=diff_ns[1:])
+time_diff_sec = diff_ns * 1e-9
+time_diff_sec[0] = np.nan  # no previous frame, as with Series.diff()
+df["time_diff_sec"] = time_diff_sec
+pass_id = np.cumsum(diff_ns > 120 * 10**9).astype(np.int32)  # 2-minute gap = new pass
+df["pass_id"] = pass_id
 
 # %% [markdown]
 # ### 4.1 Micro: Single Pass Dynamics
 # 🎯 **Dashboard widget: Live pass timeline**
 
 # %%
-# Find the longest continuous pass
-pass_sizes = df.groupby("pass_id").size()
-longest_pass_id = pass_sizes.idxmax()
-longest = df[df["pass_id"] == longest_pass_id].copy()
+# Find the longest continuous pass (pass IDs are dense, so bincount sizes them)
+pass_sizes = np.bincount(pass_id)
+longest_pass_id = pass_sizes.argmax()
+longest = df[pass_id == longest_pass_id].copy()
 
 fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 7), sharex=True)
 fig.suptitle(
@@ -540,8 +638,8 @@ plt.show()
 
 # Pass statistics
 print("Pass statistics:")
-print(f"  Total passes detected: {df['pass_id'].nunique()}")
-print(f"  Median frames/pass:   {pass_sizes.median():.0f}")
+print(f"  Total passes detected: {len(pass_sizes)}")
+print(f"  Median frames/pass:   {np.median(pass_sizes):.0f}")
 print(f"  Longest pass:          {pass_sizes.max()} frames")
 print(f"  Mean pass duration:    {pass_sizes.mean():.1f} frames")
 
@@ -552,7 +650,10 @@ print(f"  Mean pass duration:    {pass_sizes.mean():.1f} frames")
 # %%
 start_time = df["timestamp"].min()
 end_time = start_time + pd.Timedelta(days=7)
-df_week = df[(df["timestamp"] >= start_time) & (df["timestamp"] <= end_time)]
+# df is time-sorted, so the window is a contiguous slice of the ns stamps
+week_lo = np.searchsorted(ts_ns, start_time.value, side="left")
+week_hi = np.searchsorted(ts_ns, end_time.value, side="right")
+df_week = df.iloc[week_lo:week_hi]
 
 fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(14, 10), sharex=True)
 fig.suptitle(
@@ -595,9 +696,10 @@ plt.show()
 # 🎯 **Dashboard widget: Long-term health trend**
 
 # %%
-# Daily rolling averages
-df_indexed = df.set_index("timestamp")
-daily = df_indexed[ML_FEATURES].resample("1D").agg(["mean", "std"]).dropna()
+# Daily rolling averages (slice the float32 features before indexing, so
+# set_index copies only the columns being resampled)
+df_features = df[["timestamp", *ML_FEATURES]].set_index("timestamp")
+daily = df_features.resample("1D").agg(["mean", "std"]).dropna()
 
 fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 8), sharex=True)
 fig.suptitle(
@@ -643,10 +745,22 @@ plt.show()
 # 🎯 **Dashboard widget: Coverage indicator**
 
 # %%
+# Bin the frames into a 1-D density strip: one image instead of a marker per frame
+reception_counts, _ = np.histogram(ts_ns, bins=1440)
 fig, ax = plt.subplots(figsize=(14, 2.5))
-ax.scatter(
-    df["timestamp"], [1] * len(df), marker="|", alpha=0.15, color="purple", s=800
+ax.imshow(
+    reception_counts[np.newaxis, :],
+    aspect="auto",
+    cmap="Purples",
+    interpolation="nearest",
+    extent=[
+        mdates.date2num(df["timestamp"].iloc[0]),
+        mdates.date2num(df["timestamp"].iloc[-1]),
+        0,
+        1,
+    ],
 )
+ax.xaxis_date()
 ax.set_yticks([])
 ax.set_title("Data Reception Density (7 Months)")
 ax.set_xlabel("Time (UTC)")
@@ -658,19 +772,18 @@ plt.show()
 
 # Time gap distribution
 fig, ax = plt.subplots(figsize=(10, 4))
-gaps = df["time_diff_sec"].dropna()
+gaps = time_diff_sec[np.isfinite(time_diff_sec)]
+gap_median = np.median(gaps)
 sns.histplot(gaps[gaps < 300], bins=80, color="purple", alpha=0.7, ax=ax)
 ax.set_title("Time Gap Distribution (gaps < 5 min)")
 ax.set_xlabel("Seconds Between Frames")
-ax.axvline(
-    gaps.median(), color="red", linestyle="--", label=f"Median: {gaps.median():.0f}s"
-)
+ax.axvline(gap_median, color="red", linestyle="--", label=f"Median: {gap_median:.0f}s")
 ax.legend()
 save_fig(fig, "time_gap_distribution")
 plt.show()
 
 print("Time gap statistics:")
-print(f"  Median: {gaps.median():.0f}s")
+print(f"  Median: {gap_median:.0f}s")
 print(f"  Mean:   {gaps.mean():.0f}s")
 print(f"  Max:    {gaps.max():.0f}s ({gaps.max() / 3600:.1f} hours)")
 print(f"  Gaps > 1 hour: {(gaps > 3600).sum()}")
@@ -684,17 +797,20 @@ print(f"  Gaps > 1 hour: {(gaps > 3600).sum()}")
 
 # %%
 # Prepare clean data (exclude extreme values)
-df_clean = df[~((df["batt_voltage"] > 5) | (df["batt_current"].abs() > 1.0))].copy()
+df_clean = df[~extreme_mask].copy()
 print(
     f"Clean dataset: {len(df_clean)} rows (excluded {len(df) - len(df_clean)} extreme values)"
 )
 
-X_all = df_clean[ML_FEATURES].dropna()
-scaler = StandardScaler()
-X_scaled = scaler.fit_transform(X_all)
+# Standardise in place on a float32 copy instead of StandardScaler's extra arrays
+X_scaled = df_clean[ML_FEATURES].dropna().to_numpy(dtype=np.float32, copy=True)
+np.subtract(X_scaled, X_scaled.mean(axis=0), out=X_scaled)
+scale = X_scaled.std(axis=0)
+scale[scale == 0] = 1.0  # Constant features stay at 0, as with StandardScaler
+np.divide(X_scaled, scale, out=X_scaled)
 
-# PCA
-pca = PCA(n_components=5)
+# PCA (five features: eigendecomposing the 5x5 covariance beats an n x 5 SVD)
+pca = PCA(n_components=5, svd_solver="covariance_eigh")
 X_pca = pca.fit_transform(X_scaled)
 
 # Explained variance
@@ -718,7 +834,7 @@ ax1.legend()
 
 # PC1 vs PC2 scatter
 eclipse_state = np.where(
-    df_clean["temp_panel_z"].values[: len(X_pca)] > 15, "Sunlight", "Eclipse"
+    sunlit[~extreme_mask.to_numpy()][: len(X_pca)], "Sunlight", "Eclipse"
 )
 colors = np.where(eclipse_state == "Sunlight", "#f0a500", "#3a0ca3")
 ax2.scatter(X_pca[:, 0], X_pca[:, 1], c=colors, alpha=0.3, s=6, edgecolors="none")
@@ -1,11 +1,15 @@
 import os
-import json
 import time
+import random
+import asyncio
 import argparse
 import sys
+import socket
 import httpx
+import orjson
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from dotenv import load_dotenv
 
 # Modern Tooling
@@ -29,8 +33,18 @@ MAX_RETRIES = 5
 CHUNK_SIZE_DAYS = 1
 
 # Rate Limiting (SatNOGS: ~1 req/sec is safe, or 240/hr = 1 req/15s conservatively)
-# We'll stick to a safe 2s delay between requests to avoid hitting 429s constantly.
-REQUEST_DELAY_SECONDS = 5.0
+# One budget shared by all concurrent chunks: a safe 1 request every 2s on
+# average, with short bursts allowed after idle periods (e.g. 429 backoffs).
+REQUEST_RATE_PER_SECOND = 0.5
+REQUEST_BURST = 2
+
+# Retry backoff: full jitter, uniform(0, min(cap, base * 2**attempt))
+RATE_LIMIT_BACKOFF_BASE = 30.0
+NETWORK_BACKOFF_BASE = 5.0
+BACKOFF_MAX_SECONDS = 300.0
+
+# Chunks fetched concurrently; each still paces its own pages as above.
+MAX_CONCURRENT_CHUNKS = 4
 
 # --- LOAD TARGETS FROM CENTRAL REGISTRY ---
 from gr_sat.core.satellite_profiles import _SATELLITE_PROFILES
@@ -56,8 +70,56 @@ logger.configure(
 )
 
 
+def backoff_delay(retry_count: int, base: float) -> float:
+    """Exponential backoff with full jitter."""
+    return random.uniform(0, min(BACKOFF_MAX_SECONDS, base * 2**retry_count))
+
+
+def retry_after_seconds(response: httpx.Response):
+    """Parse a Retry-After header (delta-seconds or HTTP date), if present."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """Async token bucket: ``rate`` requests per second, bursts up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        # Holding the lock while waiting hands out tokens in FIFO order
+        async with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.last_refill) * self.rate
+            )
+            self.last_refill = now
+
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self.tokens = 1
+                self.last_refill = time.monotonic()
+
+            self.tokens -= 1
+
+
 class SatNOGSDownloader:
-    def __init__(self, output_dir="data/raw"):
+    def __init__(self, output_dir="data/raw", max_concurrency=MAX_CONCURRENT_CHUNKS):
         self.token = API_TOKEN
         self.base_url = SATNOGS_API_URL
         self.output_dir = Path(output_dir)
@@ -67,19 +129,37 @@ class SatNOGSDownloader:
             logger.critical("SATNOGS_API_TOKEN not found in .env file.")
             sys.exit(1)
 
-        self.session = httpx.Client(
+        # HTTP/2 lets concurrent chunks multiplex over one TLS connection.
+        # asyncio already sets TCP_NODELAY; SO_KEEPALIVE keeps that connection
+        # from being silently dropped while every chunk sits out a 429 backoff.
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency,
+            ),
+            socket_options=[(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)],
+        )
+        self.session = httpx.AsyncClient(
+            transport=transport,
+            timeout=15.0,
             headers={
                 "Authorization": f"Token {self.token}",
                 "Accept": "application/json",
-            }
+            },
         )
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.bucket = TokenBucket(REQUEST_RATE_PER_SECOND, REQUEST_BURST)
+
+    async def aclose(self):
+        await self.session.aclose()
 
-    def _get_chunk_filename(self, norad_id: str, chunk_start: datetime) -> Path:
+    def _get_chunk_filename(self, norad_id: str, date_str: str) -> Path:
         sat_dir = self.output_dir / str(norad_id)
         sat_dir.mkdir(parents=True, exist_ok=True)
-        return sat_dir / f"{chunk_start.strftime('%Y-%m-%d')}.jsonl"
+        return sat_dir / f"{date_str}.jsonl"
 
-    def download_chunk(
+    async def download_chunk(
         self,
         norad_id: str,
         chunk_start: datetime,
@@ -89,10 +169,24 @@ class SatNOGSDownloader:
     ):
         """
         Downloads frames for a specific time chunk and streams them to disk.
+        At most ``max_concurrency`` chunks are in flight at once.
         """
-        outfile = self._get_chunk_filename(norad_id, chunk_start)
-        sat_name = TARGETS.get(norad_id, "Unknown")
+        async with self.semaphore:
+            await self._download_chunk(
+                norad_id, chunk_start, chunk_end, progress_task_id, progress_obj
+            )
+
+    async def _download_chunk(
+        self,
+        norad_id: str,
+        chunk_start: datetime,
+        chunk_end: datetime,
+        progress_task_id,
+        progress_obj,
+    ):
         date_str = chunk_start.strftime("%Y-%m-%d")
+        outfile = self._get_chunk_filename(norad_id, date_str)
+        sat_name = TARGETS.get(norad_id, "Unknown")
 
         # Display Context (Persist in logs)
         log_prefix = f"[cyan]{sat_name}[/] ([dim]{norad_id}[/]) | [green]{date_str}[/]"
@@ -111,7 +205,8 @@ class SatNOGSDownloader:
         }
 
         # Update Progress Bar (Show what we are working on)
-        progress_obj.update(progress_task_id, description=f"Fetching {log_prefix}...")
+        fetching_description = f"Fetching {log_prefix}..."
+        progress_obj.update(progress_task_id, description=fetching_description)
 
         frames_downloaded = 0
         chunk_seen_hashes = set()  # Circuit breaker for infinite page loops
@@ -121,45 +216,53 @@ class SatNOGSDownloader:
         current_url = self.base_url
         current_params = params
 
-        with open(outfile, "a") as f:
+        # Frames go to a .part file that only replaces outfile once every page
+        # is in, so an interrupted chunk is never mistaken for a finished one.
+        partfile = outfile.with_name(outfile.name + ".part")
+        chunk_failed = False
+
+        # File I/O goes through to_thread so a slow disk never stalls the
+        # event loop the other chunks are downloading on
+        f = await asyncio.to_thread(open, partfile, "wb")
+        try:
             while True:
                 retry_count = 0
                 success = False
 
-                # Enforce Rate Limit (Pre-emptive)
-                time.sleep(REQUEST_DELAY_SECONDS)
-
                 # Retry Loop
                 while retry_count < MAX_RETRIES:
                     try:
-                        # Use params only if we are hitting the base URL (first page)
-                        # If we are following a 'next' link, params are already in the string.
-                        req_params = (
-                            current_params if current_url == self.base_url else None
-                        )
-
-                        response = self.session.get(
-                            current_url, params=req_params, timeout=15
+                        # Enforce Rate Limit (shared across chunks)
+                        await self.bucket.acquire()
+                        # current_params is None once we follow 'next' links,
+                        # which already carry the query string.
+                        response = await self.session.get(
+                            current_url, params=current_params
                         )
 
                         if response.status_code == 429:
-                            sleep_time = 60 * (retry_count + 1)
+                            sleep_time = retry_after_seconds(response)
+                            if sleep_time is None:
+                                sleep_time = backoff_delay(
+                                    retry_count, RATE_LIMIT_BACKOFF_BASE
+                                )
                             logger.warning(
-                                f"{log_prefix} | [yellow]Rate Limit (429)[/] Sleeping {sleep_time}s..."
+                                f"{log_prefix} | [yellow]Rate Limit (429)[/] Sleeping {sleep_time:.0f}s..."
                             )
 
-                            # Visual Countdown
-                            for remaining in range(sleep_time, 0, -1):
-                                progress_obj.update(
-                                    progress_task_id,
-                                    description=f"[yellow]Rate Limit: Sleeping {remaining}s...[/] {log_prefix}",
-                                )
-                                time.sleep(1)
+                            # The bar is not redrawn during the sleep, so show
+                            # when it ends rather than a countdown
+                            resume_at = datetime.now() + timedelta(seconds=sleep_time)
+                            progress_obj.update(
+                                progress_task_id,
+                                description=f"[yellow]Rate Limit: Sleeping until {resume_at:%H:%M:%S}...[/] {log_prefix}",
+                            )
+                            await asyncio.sleep(sleep_time)
 
                             # Restore description
                             progress_obj.update(
                                 progress_task_id,
-                                description=f"Fetching {log_prefix}...",
+                                description=fetching_description,
                             )
                             retry_count += 1
                             continue
@@ -170,7 +273,7 @@ class SatNOGSDownloader:
                             break
 
                         response.raise_for_status()
-                        raw_data = response.json()
+                        raw_data = orjson.loads(response.content)
 
                         # Handle Pagination
                         if isinstance(raw_data, dict) and "results" in raw_data:
@@ -185,10 +288,13 @@ class SatNOGSDownloader:
 
                     except Exception as e:
                         logger.error(f"{log_prefix} | Network Error: {e}")
-                        time.sleep(5 * (retry_count + 1))
+                        await asyncio.sleep(
+                            backoff_delay(retry_count, NETWORK_BACKOFF_BASE)
+                        )
                         retry_count += 1
 
                 if not success:
+                    chunk_failed = retry_count >= MAX_RETRIES
                     break
 
                 if not frames_list:
@@ -207,9 +313,15 @@ class SatNOGSDownloader:
                     chunk_seen_hashes.add(page_sig)
                 # ----------------------------------------
 
-                for frame in frames_list:
-                    f.write(json.dumps(frame) + "\n")
-                    frames_downloaded += 1
+                # One write per page
+                await asyncio.to_thread(
+                    f.write,
+                    b"".join(
+                        orjson.dumps(frame, option=orjson.OPT_APPEND_NEWLINE)
+                        for frame in frames_list
+                    ),
+                )
+                frames_downloaded += len(frames_list)
 
                 # PAGINATION UPDATE
                 # Check for 'next' link. If present, use it for the next iteration.
@@ -219,17 +331,40 @@ class SatNOGSDownloader:
                     current_params = None  # Clear params since they are in the URL now
                 else:
                     break  # End of pages
+        finally:
+            await asyncio.to_thread(f.close)
 
         # Cleanup
-        if frames_downloaded == 0:
-            if outfile.exists() and outfile.stat().st_size == 0:
-                outfile.unlink()
-                if success:
-                    logger.info(f"{log_prefix} | [yellow]Empty (0 frames)[/]")
+        if chunk_failed:
+            partfile.unlink()
+            logger.error(
+                f"{log_prefix} | [red]Gave up after {MAX_RETRIES} retries[/] "
+                f"({frames_downloaded} frames discarded, will retry next run)"
+            )
+        elif frames_downloaded == 0:
+            partfile.unlink()
+            if success:
+                logger.info(f"{log_prefix} | [yellow]Empty (0 frames)[/]")
         else:
+            os.replace(partfile, outfile)
             logger.success(f"{log_prefix} | Saved {frames_downloaded} frames")
 
 
+async def download_all(downloader, chunks, progress_task_id, progress_obj):
+    """Fetch every (norad_id, chunk_start, chunk_end) concurrently."""
+
+    async def fetch(norad_id, chunk_start, chunk_end):
+        await downloader.download_chunk(
+            norad_id, chunk_start, chunk_end, progress_task_id, progress_obj
+        )
+        progress_obj.advance(progress_task_id)
+
+    try:
+        await asyncio.gather(*(fetch(*chunk) for chunk in chunks))
+    finally:
+        await downloader.aclose()
+
+
 @logger.catch
 def main():
     parser = argparse.ArgumentParser(description="SatNOGS Downloader")
@@ -316,20 +451,20 @@ def main():
     ) as progress:
         main_task = progress.add_task("[green]Total Progress", total=total_steps)
 
+        chunks = []
         current_dt = start_dt
         while current_dt < end_dt:
             chunk_end = current_dt + timedelta(days=CHUNK_SIZE_DAYS)
             if chunk_end > end_dt:
                 chunk_end = end_dt
 
-            for norad_id, name in targets.items():
-                downloader.download_chunk(
-                    norad_id, current_dt, chunk_end, main_task, progress
-                )
-                progress.advance(main_task)
+            for norad_id in targets:
+                chunks.append((norad_id, current_dt, chunk_end))
 
             current_dt = chunk_end
 
+        asyncio.run(download_all(downloader, chunks, main_task, progress))
+
     logger.success("Download Complete.")
 
 
@@ -1,4 +1,5 @@
 from skyfield.api import load, wgs84
+import numpy as np
 import pandas as pd
 from pathlib import Path
 import datetime
@@ -70,73 +71,63 @@ def main():
     )
     print(f"Filter: Max Elevation > {MIN_ALTITUDE_DEG}°")
 
+    # Names/frequencies from the candidate analysis, keyed by NORAD id
+    if INPUT_FILE.exists():
+        candidates = pd.read_csv(
+            INPUT_FILE, usecols=["norad_cat_id", "amsat_name", "primary_freq", "mode"]
+        )
+        cand_lookup = (
+            candidates.drop_duplicates("norad_cat_id")
+            .set_index("norad_cat_id")
+            .to_dict("index")
+        )
+    else:
+        print(f"Warning: {INPUT_FILE} not found, using TLE names only.")
+        cand_lookup = {}
+
     pass_data = []
 
     for sat in my_sats:
+        topocentric = sat - ground_station
+        cand_row = cand_lookup.get(sat.model.satnum, {})
         # find_events returns: times, events (0=rise, 1=culminate, 2=set)
         times, events = sat.find_events(ground_station, t0, t1, altitude_degrees=0.0)
 
-        # We need to group events into passes (Rise -> Set)
-        # Simplified: Iterate through events
-        current_rise = None
-
-        for ti, event in zip(times, events):
-            if event == 0:  # Rise
-                current_rise = ti
-            elif event == 2:  # Set
-                if current_rise is not None:
-                    # We have a complete pass, find max elevation
-                    # It's usually roughly between rise and set
-                    # Ideally we check the culmination event if it exists in between
-
-                    # Let's verify peak altitude
-                    # (Simplified: check mid-point or just use culmination if provided by find_events)
-                    # Actually find_events gives 0,1,2. 1 is culmination.
-                    pass
-                current_rise = None
-
-        # Re-run with finding culmination to get exact max alt
-        # Or just iterate: find indices where event=1
-        for i in range(len(events)):
-            if events[i] == 1:  # Culminate (Max Alt)
-                # Check if it has a rise before and set after ideally, but mainly check alt
-                t_peak = times[i]
-                alt, az, distance = (sat - ground_station).at(t_peak).altaz()
-
-                if alt.degrees >= MIN_ALTITUDE_DEG:
-                    # Find rise time (searching backwards)
-                    t_rise = None
-                    for j in range(i, -1, -1):
-                        if events[j] == 0:
-                            t_rise = times[j]
-                            break
-
-                    # Find set time (searching forwards)
-                    t_set = None
-                    for j in range(i, len(events)):
-                        if events[j] == 2:
-                            t_set = times[j]
-                            break
-
-                    if t_rise is not None and t_set is not None:
-                        # Extract Name from candidates
-                        cand_row = candidates[
-                            candidates["norad_cat_id"] == sat.model.satnum
-                        ].iloc[0]
-
-                        pass_data.append(
-                            {
-                                "norad_id": sat.model.satnum,
-                                "name": cand_row["amsat_name"],  # Use our clean name
-                                "frequency": cand_row["primary_freq"],
-                                "mode": cand_row["mode"],
-                                "rise_time": t_rise.utc_iso(),
-                                "peak_time": t_peak.utc_iso(),
-                                "set_time": t_set.utc_iso(),
-                                "max_elev": round(alt.degrees, 1),
-                                "duration_min": round((t_set - t_rise) * 24 * 60, 1),
-                            }
-                        )
+        if not len(events):
+            continue
+
+        # One vectorized altaz() over all event times; only culminations are read
+        alt_deg = topocentric.at(times).altaz()[0].degrees
+
+        # Pair each high culmination with the last rise before it and the
+        # first set after it
+        rise_idx = np.flatnonzero(events == 0)
+        set_idx = np.flatnonzero(events == 2)
+        peak_idx = np.flatnonzero((events == 1) & (alt_deg >= MIN_ALTITUDE_DEG))
+        rise_pos = np.searchsorted(rise_idx, peak_idx) - 1
+        set_pos = np.searchsorted(set_idx, peak_idx)
+
+        for i, r, s in zip(peak_idx, rise_pos, set_pos):
+            if r < 0 or s == len(set_idx):
+                continue
+            t_rise = times[rise_idx[r]]
+            t_peak = times[i]
+            t_set = times[set_idx[s]]
+
+            pass_data.append(
+                {
+                    "norad_id": sat.model.satnum,
+                    # Use our clean name
+                    "name": cand_row.get("amsat_name", sat.name),
+                    "frequency": cand_row.get("primary_freq"),
+                    "mode": cand_row.get("mode"),
+                    "rise_time": t_rise.utc_iso(),
+                    "peak_time": t_peak.utc_iso(),
+                    "set_time": t_set.utc_iso(),
+                    "max_elev": round(alt_deg[i], 1),
+                    "duration_min": round((t_set - t_rise) * 24 * 60, 1),
+                }
+            )
 
     # Output
     df_passes = pd.DataFrame(pass_data)
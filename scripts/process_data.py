@@ -8,6 +8,7 @@ Implements the full data refinement pipeline for Project Watchdog:
     data/interim/{norad_id}.csv   (All decoded fields, unmodified)
       ↓  Stage 2: Adapt (Unit conversion + field mapping)
     data/processed/{norad_id}.csv (SI-unit Golden Features, ML-ready)
+    data/processed/{norad_id}.parquet (same, columnar/zstd for fast reloads)
 
 Usage:
     pixi run python scripts/process_data.py --norad 43880
@@ -16,10 +17,17 @@ Usage:
     just process --norad 43880      # Specific satellite
 """
 
-import json
 import argparse
+from binascii import a2b_hex
 from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from itertools import repeat
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from pathlib import Path
 
 from loguru import logger
@@ -40,6 +48,23 @@ RAW_DIR = Path("data/raw")
 INTERIM_DIR = Path("data/interim")
 PROCESSED_DIR = Path("data/processed")
 
+# Golden Feature sensor readings written as float32 in the Parquet copy
+FLOAT32_COLUMNS = (
+    "batt_voltage",
+    "batt_current",
+    "batt_a_voltage",
+    "batt_b_voltage",
+    "batt_a_current",
+    "batt_b_current",
+    "power_consumption",
+    "temp_obc",
+    "temp_batt_a",
+    "temp_batt_b",
+    "temp_panel_z",
+)
+# Low-cardinality AX.25 identifiers stored dictionary-encoded in the Parquet copy
+CATEGORY_COLUMNS = ("src_callsign", "dest_callsign")
+
 # Ensure output directories exist
 INTERIM_DIR.mkdir(parents=True, exist_ok=True)
 PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
@@ -52,19 +77,124 @@ logger.configure(
 )
 
 
-def load_raw_frames(sat_dir: Path) -> list[dict]:
-    """Read all JSONL files for a satellite and return a list of raw records."""
+def load_raw_file(filepath: Path) -> list[dict]:
+    """Read one JSONL file and return its raw records."""
     frames = []
-    for filepath in sorted(sat_dir.glob("*.jsonl")):
-        with open(filepath, "r") as f:
-            for line in f:
-                try:
-                    frames.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
+    # orjson parses the raw bytes directly, skipping the text decode
+    with open(filepath, "rb") as f:
+        for line in f:
+            try:
+                frames.append(orjson.loads(line))
+            except orjson.JSONDecodeError:
+                continue
     return frames
 
 
+def _append_row(columns: dict[str, list], n_rows: int, row: dict) -> None:
+    """
+    Append one record to `columns`, which currently hold n_rows rows.
+
+    Kaitai structs omit fields that did not parse, so the field set differs
+    from frame to frame: gaps on either side are padded with None. New
+    columns keep first-seen order, as pd.DataFrame(list_of_dicts) would.
+    """
+    for key, value in row.items():
+        column = columns.get(key)
+        if column is None:
+            column = columns[key] = [None] * n_rows
+        column.append(value)
+    if len(row) < len(columns):
+        # This frame lacks fields that earlier frames carried
+        for column in columns.values():
+            if len(column) == n_rows:
+                column.append(None)
+
+
+def _extend_columns(
+    columns: dict[str, list], n_rows: int, new: dict[str, list], n_new: int
+) -> None:
+    """Merge n_new rows held column-wise in `new` into `columns` (n_rows long)."""
+    for key, values in new.items():
+        column = columns.get(key)
+        if column is None:
+            columns[key] = [None] * n_rows + values
+        else:
+            column.extend(values)
+    for column in columns.values():
+        if len(column) < n_rows + n_new:
+            column.extend([None] * (n_rows + n_new - len(column)))
+
+
+def decode_raw_file(
+    filepath: Path, norad_id: int
+) -> tuple[dict[str, list], int, Counter, int]:
+    """
+    Stage 1 for a single JSONL file.
+
+    Runs in a worker process, so it looks the decoder up itself. Returns the
+    decoded fields as columns (one list per field), the number of decoded
+    rows, the failure counts by code, and the number of records read.
+    """
+    decoder = DecoderRegistry.get_decoder(norad_id)
+    records = load_raw_file(filepath)
+    columns: dict[str, list] = {}
+    n_rows = 0
+    failure_counts: Counter[str] = Counter()
+
+    for record in records:
+        hex_payload = record.get("frame")
+        timestamp_str = record.get("timestamp")
+
+        if not hex_payload or not timestamp_str:
+            continue
+
+        try:
+            payload_bytes = a2b_hex(hex_payload)
+            decoded_outcome = decoder.decode_with_diagnostics(payload_bytes)
+
+            if decoded_outcome.ok:
+                decoded = dict(decoded_outcome.data)
+                decoded["timestamp"] = timestamp_str
+                decoded["observation_id"] = record.get("observation_id")
+                decoded["raw_frame"] = hex_payload
+                _append_row(columns, n_rows, decoded)
+                n_rows += 1
+            else:
+                failure_counts[decoded_outcome.failure.code] += 1
+
+        except ValueError:
+            failure_counts["invalid_hex_payload"] += 1
+            continue
+
+    return columns, n_rows, failure_counts, len(records)
+
+
+def write_parquet(df: pd.DataFrame, path: Path) -> None:
+    """
+    Write a DataFrame as zstd-compressed Parquet.
+
+    SI-unit sensor readings are stored as float32: they carry a few
+    significant digits, so the narrower type is lossless in practice and
+    halves those columns in memory for readers. Counters such as uptime
+    (which exceeds float32's 24-bit mantissa) keep their 64-bit types.
+    Callsigns are written as categoricals, so readers get one small code
+    per row instead of a string object.
+    """
+    narrow = {
+        column: "float32"
+        for column in FLOAT32_COLUMNS
+        if column in df.columns and df[column].dtype == "float64"
+    }
+    narrow.update(
+        {column: "category" for column in CATEGORY_COLUMNS if column in df.columns}
+    )
+    pq.write_table(
+        pa.Table.from_pandas(df.astype(narrow), preserve_index=False),
+        path,
+        compression="zstd",
+    )
+
+
 def _log_failure_breakdown(stage_name: str, counts: Counter) -> None:
     if not counts:
         return
@@ -72,12 +202,19 @@ def _log_failure_breakdown(stage_name: str, counts: Counter) -> None:
     logger.info(f"{stage_name} failure breakdown: {breakdown}")
 
 
-def process_satellite(norad_id: str):
+def list_raw_files(norad_id: str) -> list[Path]:
+    return sorted((RAW_DIR / str(norad_id)).glob("*.jsonl"))
+
+
+def process_satellite(norad_id: str, decoded: Iterator[tuple] | None = None):
     """
     Run the full pipeline for a single satellite:
       1. Load raw JSONL frames from data/raw/{norad_id}/
       2. Decode via Kaitai Structs → data/interim/{norad_id}.csv
-      3. Adapt to Golden Features → data/processed/{norad_id}.csv
+      3. Adapt to Golden Features → data/processed/{norad_id}.csv (+ .parquet)
+
+    `decoded` takes Stage 1 results already submitted to a shared pool (see
+    process_all), in list_raw_files() order; otherwise a pool is started here.
     """
     norad_int = int(norad_id)
     sat_dir = RAW_DIR / str(norad_id)
@@ -101,68 +238,61 @@ def process_satellite(norad_id: str):
         logger.error(str(exc))
         return
 
-    # Load raw data
-    raw_records = load_raw_frames(sat_dir)
-    if not raw_records:
+    raw_files = list_raw_files(norad_id)
+    if not raw_files:
         logger.warning(f"No .jsonl records found in {sat_dir}")
         return
 
-    logger.info(
-        f"Processing [cyan]NORAD {norad_id}[/] — "
-        f"{len(raw_records)} raw frames from {len(list(sat_dir.glob('*.jsonl')))} files"
-    )
+    logger.info(f"Processing [cyan]NORAD {norad_id}[/] — {len(raw_files)} raw files")
 
     # --- Stage 1: Decode (raw bytes → interim) ---
-    interim_rows = []
-    decode_failures = 0
+    # Files are independent and decoding is CPU-bound (Kaitai holds the GIL),
+    # so each file goes to its own worker process; map() keeps file order.
+    interim_columns: dict[str, list] = {}
+    interim_row_count = 0
+    raw_record_count = 0
     decode_failure_counts: Counter[str] = Counter()
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TextColumn("{task.completed}/{task.total}"),
-    ) as progress:
+    with (
+        Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TextColumn("{task.completed}/{task.total} files"),
+        ) as progress,
+        ExitStack() as stack,
+    ):
         task = progress.add_task(
-            f"[green]Stage 1: Decoding {norad_id}...", total=len(raw_records)
+            f"[green]Stage 1: Decoding {norad_id}...", total=len(raw_files)
         )
 
-        for record in raw_records:
-            progress.advance(task)
-
-            hex_payload = record.get("frame")
-            timestamp_str = record.get("timestamp")
+        if decoded is None:
+            pool = stack.enter_context(ProcessPoolExecutor())
+            decoded = pool.map(decode_raw_file, raw_files, repeat(norad_int))
 
-            if not hex_payload or not timestamp_str:
-                continue
+        for columns, n_rows, failure_counts, n_records in decoded:
+            _extend_columns(interim_columns, interim_row_count, columns, n_rows)
+            interim_row_count += n_rows
+            decode_failure_counts.update(failure_counts)
+            raw_record_count += n_records
+            progress.advance(task)
 
-            try:
-                payload_bytes = bytes.fromhex(hex_payload)
-                decoded_outcome = decoder.decode_with_diagnostics(payload_bytes)
-
-                if decoded_outcome.ok:
-                    decoded = dict(decoded_outcome.data)
-                    decoded["timestamp"] = timestamp_str
-                    decoded["observation_id"] = record.get("observation_id")
-                    decoded["raw_frame"] = hex_payload
-                    interim_rows.append(decoded)
-                else:
-                    decode_failures += 1
-                    decode_failure_counts[decoded_outcome.failure.code] += 1
+    if not raw_record_count:
+        logger.warning(f"No .jsonl records found in {sat_dir}")
+        return
 
-            except ValueError:
-                decode_failures += 1
-                decode_failure_counts["invalid_hex_payload"] += 1
-                continue
+    decode_failures = sum(decode_failure_counts.values())
+    logger.info(f"Read {raw_record_count} raw frames for NORAD {norad_id}")
 
-    if not interim_rows:
+    if not interim_row_count:
         logger.warning(f"No valid frames decoded for NORAD {norad_id}")
         _log_failure_breakdown("Decode", decode_failure_counts)
         return
 
     # Build interim DataFrame
-    df_interim = pd.DataFrame(interim_rows)
-    df_interim["timestamp"] = pd.to_datetime(df_interim["timestamp"])
+    df_interim = pd.DataFrame(interim_columns)
+    # SatNOGS timestamps are ISO 8601; naming the format skips per-call inference
+    df_interim["timestamp"] = pd.to_datetime(df_interim["timestamp"], format="ISO8601")
     df_interim = df_interim.sort_values("timestamp")
 
     # Save interim (all Kaitai fields, unmodified)
@@ -176,30 +306,34 @@ def process_satellite(norad_id: str):
     _log_failure_breakdown("Decode", decode_failure_counts)
 
     # --- Stage 2: Adapt (interim → processed Golden Features) ---
-    adapted_rows = []
+    processed_columns: dict[str, list] = {}
+    processed_row_count = 0
     adapt_failures = 0
     adapt_failure_counts: Counter[str] = Counter()
 
-    for _, row in df_interim.iterrows():
-        adapted_outcome = decoder.adapt_with_diagnostics(row.to_dict())
+    # to_dict("records") boxes the rows in one pass; iterrows() built a
+    # Series per row, which cost more than the adapt calls themselves
+    for row in df_interim.to_dict("records"):
+        adapted_outcome = decoder.adapt_with_diagnostics(row)
         if adapted_outcome.ok:
             adapted = dict(adapted_outcome.data)
             adapted["timestamp"] = row["timestamp"]
             adapted["observation_id"] = row.get("observation_id")
             if "raw_frame" in row:
                 adapted["raw_frame"] = row["raw_frame"]
-            adapted_rows.append(adapted)
+            _append_row(processed_columns, processed_row_count, adapted)
+            processed_row_count += 1
         else:
             adapt_failures += 1
             adapt_failure_counts[adapted_outcome.failure.code] += 1
 
-    if not adapted_rows:
+    if not processed_row_count:
         logger.warning(f"No frames adapted for NORAD {norad_id}")
         _log_failure_breakdown("Adapt", adapt_failure_counts)
         return
 
     # Build processed DataFrame
-    df_processed = pd.DataFrame(adapted_rows)
+    df_processed = pd.DataFrame(processed_columns)
 
     df_processed, dedup_stats = deduplicate_processed_frames(df_processed)
     dupes = dedup_stats["exact_duplicates_removed"]
@@ -226,7 +360,12 @@ def process_satellite(norad_id: str):
 
     # Save processed (Golden Features, ML-ready)
     processed_file = PROCESSED_DIR / f"{norad_id}.csv"
+    # pandas keeps the '.0' on whole floats; Arrow's writer drops it, and
+    # readers that infer types would then see integer columns
     df_processed.to_csv(processed_file, index=False)
+    # Columnar copy for loaders that only need a few columns
+    processed_parquet = PROCESSED_DIR / f"{norad_id}.parquet"
+    write_parquet(df_processed, processed_parquet)
 
     logger.success(
         f"Stage 2 complete → [bold]{processed_file}[/] "
@@ -252,6 +391,24 @@ def process_satellite(norad_id: str):
     logger.info(f"  Processed: {len(df_processed):>6} rows → {processed_file}")
 
 
+def process_all(norad_ids: list[str]) -> None:
+    """
+    Run process_satellite() for several satellites over one worker pool.
+
+    Executor.map() submits eagerly, so every satellite's files are queued up
+    front and later satellites decode while earlier ones run Stage 2 here.
+    """
+    with ProcessPoolExecutor() as pool:
+        pending = {
+            norad_id: pool.map(
+                decode_raw_file, list_raw_files(norad_id), repeat(int(norad_id))
+            )
+            for norad_id in norad_ids
+        }
+        for norad_id in norad_ids:
+            process_satellite(norad_id, decoded=pending.pop(norad_id))
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Telemetry Processing Pipeline — raw → interim → processed"
@@ -271,13 +428,15 @@ def main():
         process_satellite(args.norad)
     elif args.all:
         # Process all satellite directories that have a registered decoder
+        norad_ids = []
         for sat_dir in sorted(RAW_DIR.iterdir()):
             if sat_dir.is_dir():
                 norad_id = sat_dir.name
                 if DecoderRegistry.get_decoder(int(norad_id)):
-                    process_satellite(norad_id)
+                    norad_ids.append(norad_id)
                 else:
                     logger.debug(f"Skipping {norad_id} (no registered decoder)")
+        process_all(norad_ids)
     else:
         # Interactive: list available satellites
         sat_dirs = sorted(
@@ -299,8 +458,7 @@ def main():
         choice = input("\n> Select [A]: ").strip().upper()
 
         if choice == "A" or choice == "":
-            for nid in sat_dirs:
-                process_satellite(nid)
+            process_all(sat_dirs)
         else:
             try:
                 idx = int(choice) - 1
@@ -32,6 +32,8 @@ def seed_satellite(norad_id: int):
 
     df = pd.read_csv(csv_path)
     logger.info(f"Loaded {len(df)} rows from {csv_path}")
+    # Parsed once here; the scoring copy below inherits the datetime column
+    df["timestamp"] = pd.to_datetime(df["timestamp"], format="ISO8601")
 
     engine = get_engine()
     if not engine:
@@ -46,7 +48,6 @@ def seed_satellite(norad_id: int):
         logger.info(f"Trained model found for NORAD {norad_id}. Anomaly scores will be computed during seeding.")
         # Compute anomaly scores for the whole dataframe
         score_df = df.copy()
-        score_df["timestamp"] = pd.to_datetime(score_df["timestamp"])
         score_df["is_anomaly"] = False
         score_df["anomaly_score"] = float("nan")
         try:
@@ -63,9 +64,6 @@ def seed_satellite(norad_id: int):
         df["anomaly_score"] = None
         df["is_anomaly"] = False
 
-    # Convert timestamps
-    df["timestamp"] = pd.to_datetime(df["timestamp"])
-
     batch_size = 500
     rows_added = 0
 
@@ -1,4 +1,5 @@
 import pandas as pd
+import pyarrow.parquet as pq
 import matplotlib.pyplot as plt
 import seaborn as sns
 from pathlib import Path
@@ -9,6 +10,11 @@ PROCESSED_DIR = Path("data/processed")
 FIG_DIR = Path("docs/figures")
 FIG_DIR.mkdir(parents=True, exist_ok=True)
 
+PLOT_COLUMNS = ["timestamp", "batt_voltage", "batt_current", "temp_obc", "temp_batt_a"]
+# Beacons arrive every few seconds during a pass; one mean per bin is plenty
+# for a months-long overview plot
+RESAMPLE_RULE = "5min"
+
 # Style
 sns.set_theme(
     style="whitegrid",
@@ -17,17 +23,33 @@ sns.set_theme(
 )
 
 
-def plot_satellite(norad_id: str):
+def load_processed(norad_id: str) -> pd.DataFrame | None:
+    """Load the plotted columns, preferring the Parquet copy over the CSV."""
+    parquet_path = PROCESSED_DIR / f"{norad_id}.parquet"
     csv_path = PROCESSED_DIR / f"{norad_id}.csv"
-    if not csv_path.exists():
-        print(f"No processed data found at {csv_path}")
-        return
 
-    print(f"Loading {csv_path}...")
-    df = pd.read_csv(csv_path)
+    if parquet_path.exists():
+        print(f"Loading {parquet_path}...")
+        # Only the plotted columns are read from disk
+        available = set(pq.read_schema(parquet_path).names)
+        columns = [c for c in PLOT_COLUMNS if c in available]
+        return pd.read_parquet(parquet_path, columns=columns)
+
+    if csv_path.exists():
+        print(f"Loading {csv_path}...")
+        # Same column subset as the Parquet path; the rest is never plotted
+        df = pd.read_csv(csv_path, usecols=lambda c: c in PLOT_COLUMNS)
+        df["timestamp"] = pd.to_datetime(df["timestamp"], format="ISO8601")
+        return df
+
+    print(f"No processed data found at {parquet_path} or {csv_path}")
+    return None
 
-    # Parse timestamp
-    df["timestamp"] = pd.to_datetime(df["timestamp"])
+
+def plot_satellite(norad_id: str):
+    df = load_processed(norad_id)
+    if df is None:
+        return
 
     # Sort
     df.sort_values("timestamp", inplace=True)
@@ -35,28 +57,27 @@ def plot_satellite(norad_id: str):
     print(f"Data Range: {df['timestamp'].min()} -> {df['timestamp'].max()}")
     print(df[["batt_voltage", "batt_current", "temp_obc"]].describe())
 
+    # Downsample before drawing; empty bins (between passes) are dropped
+    plot_df = (
+        df.set_index("timestamp").resample(RESAMPLE_RULE).mean().dropna(how="all")
+    )
+    print(f"Plotting {len(plot_df)} {RESAMPLE_RULE} means of {len(df)} frames")
+
     # Create Plot
     fig, axes = plt.subplots(3, 1, figsize=(12, 10), sharex=True)
 
     # 1. Power
-    sns.lineplot(
-        data=df,
-        x="timestamp",
-        y="batt_voltage",
-        ax=axes[0],
-        color="tab:blue",
-        label="Voltage (V)",
+    axes[0].plot(
+        plot_df.index, plot_df["batt_voltage"], color="tab:blue", label="Voltage (V)"
     )
     axes[0].set_ylabel("Voltage (V)")
     axes[0].set_title(f"UWE-4 (NORAD {norad_id}) - Power System")
     axes[0].legend(loc="upper right")
 
     # 2. Current
-    sns.lineplot(
-        data=df,
-        x="timestamp",
-        y="batt_current",
-        ax=axes[1],
+    axes[1].plot(
+        plot_df.index,
+        plot_df["batt_current"],
         color="tab:orange",
         label="Current (A)",
     )
@@ -64,25 +85,19 @@ def plot_satellite(norad_id: str):
     axes[1].legend(loc="upper right")
 
     # 3. Thermal
-    sns.lineplot(
-        data=df,
-        x="timestamp",
-        y="temp_obc",
-        ax=axes[2],
-        color="tab:red",
-        label="OBC Temp (°C)",
+    axes[2].plot(
+        plot_df.index, plot_df["temp_obc"], color="tab:red", label="OBC Temp (°C)"
     )
-    if "temp_batt_a" in df.columns:
-        sns.lineplot(
-            data=df,
-            x="timestamp",
-            y="temp_batt_a",
-            ax=axes[2],
+    if "temp_batt_a" in plot_df.columns:
+        axes[2].plot(
+            plot_df.index,
+            plot_df["temp_batt_a"],
             color="tab:purple",
             label="Batt A Temp (°C)",
         )
 
     axes[2].set_ylabel("Temp (°C)")
+    axes[2].set_xlabel("timestamp")
     axes[2].legend(loc="upper right")
 
     plt.tight_layout()
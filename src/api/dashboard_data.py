@@ -533,7 +533,7 @@ class DashboardDataRepository:
                 raise FileNotFoundError(f"Processed dataset not found at {data_path}")
 
             df = pd.read_csv(data_path)
-            df["timestamp"] = pd.to_datetime(df["timestamp"])
+            df["timestamp"] = pd.to_datetime(df["timestamp"], format="ISO8601")
             df = df.sort_values("timestamp")
 
             # Clean and filter using baseline profiles
@@ -9,6 +9,8 @@ from datetime import timedelta, timezone
 from typing import Any
 from pathlib import Path
 
+import numpy as np
+
 try:
     from .serialization import timestamp_iso
 except ImportError:
@@ -124,6 +126,7 @@ def predict_passes(
             continue
 
         sat = by_id[sat_id]
+        topocentric = sat - gs
         t, events = sat.find_events(gs, t0, t1, altitude_degrees=0.0)
 
         for i in range(len(events)):
@@ -131,7 +134,7 @@ def predict_passes(
                 continue
 
             t_peak = t[i]
-            alt, az, dist = (sat - gs).at(t_peak).altaz()
+            alt, az, dist = topocentric.at(t_peak).altaz()
 
             if alt.degrees < min_elevation:
                 continue
@@ -143,8 +146,8 @@ def predict_passes(
                 continue
 
             # Determine general direction
-            start_az = (sat - gs).at(t_rise).altaz()[1].degrees
-            end_az = (sat - gs).at(t_set).altaz()[1].degrees
+            start_az = topocentric.at(t_rise).altaz()[1].degrees
+            end_az = topocentric.at(t_set).altaz()[1].degrees
 
             direction = "N->S" if end_az > start_az else "S->N"
             if abs(start_az - end_az) > 180:  # cross 360
@@ -159,7 +162,9 @@ def predict_passes(
                 "direction": direction,
             }
             if include_tracks:
-                pass_record["track"] = _sample_track(sat, gs, ts, t_rise, t_set)
+                pass_record["track"] = _sample_track(
+                    sat, topocentric, ts, t_rise, t_set
+                )
             passes.append(pass_record)
 
     passes.sort(key=lambda p: p["aos"])
@@ -192,30 +197,34 @@ def _find_event_after(t, events, index: int, event_type: int):
 
 
 def _sample_track(
-    sat, gs, ts, t_rise, t_set, sample_count: int = 32
+    sat, topocentric, ts, t_rise, t_set, sample_count: int = 32
 ) -> list[dict[str, Any]]:
     """Sample the ground track of a satellite pass at *sample_count* points."""
-    start_dt = t_rise.utc_datetime()
-    end_dt = t_set.utc_datetime()
-    duration_seconds = (end_dt - start_dt).total_seconds()
-    if duration_seconds <= 0:
+    if t_set.tt <= t_rise.tt:
         return []
 
-    track: list[dict[str, Any]] = []
-    for sample_index in range(sample_count):
-        offset = duration_seconds * sample_index / max(sample_count - 1, 1)
-        sample_dt = start_dt + timedelta(seconds=offset)
-        sample_t = ts.from_datetime(sample_dt)
-        subpoint = sat.at(sample_t).subpoint()
-        alt, az, distance = (sat - gs).at(sample_t).altaz()
-        track.append(
-            {
-                "time": timestamp_iso(sample_dt),
-                "lat": round(subpoint.latitude.degrees, 4),
-                "lon": round(subpoint.longitude.degrees, 4),
-                "elevation": round(alt.degrees, 1),
-                "azimuth": round(az.degrees, 1),
-                "range_km": round(distance.km, 1),
-            }
+    # Step through the pass on the TT Julian-date scale and propagate every
+    # sample in one array call rather than one scalar SGP4 call per point
+    step_days = (t_set.tt - t_rise.tt) / max(sample_count - 1, 1)
+    sample_t = ts.tt_jd(t_rise.tt + step_days * np.arange(sample_count))
+    subpoints = sat.at(sample_t).subpoint()
+    alt, az, distance = topocentric.at(sample_t).altaz()
+
+    return [
+        {
+            "time": timestamp_iso(sample_dt),
+            "lat": round(lat, 4),
+            "lon": round(lon, 4),
+            "elevation": round(el, 1),
+            "azimuth": round(azimuth, 1),
+            "range_km": round(range_km, 1),
+        }
+        for sample_dt, lat, lon, el, azimuth, range_km in zip(
+            sample_t.utc_datetime(),
+            subpoints.latitude.degrees,
+            subpoints.longitude.degrees,
+            alt.degrees,
+            az.degrees,
+            distance.km,
         )
-    return track
+    ]
@@ -23,7 +23,7 @@ class CuteDecoder(BaseDecoder):
         return outcome.data if outcome.ok else None
 
     def decode_with_diagnostics(self, payload: bytes):
-        import satnogsdecoders.decoder as dec
+        from gr_sat.core.decoders.kaitai import get_fields
         from gr_sat.core.telemetry import StageOutcome, ProcessingFailure
         try:
             struct = cute.Cute.from_bytes(payload)
@@ -37,7 +37,7 @@ class CuteDecoder(BaseDecoder):
             )
 
         try:
-            data = dec.get_fields(struct)
+            data = get_fields(struct)
         except Exception as exc:
             return StageOutcome(
                 failure=ProcessingFailure(
@@ -0,0 +1,73 @@
+"""
+Cached field extraction for satnogs-decoders Kaitai structs.
+
+satnogsdecoders.decoder.get_fields() re-parses the struct's ``:field``
+docstring with a regex on every frame. That docstring belongs to the class,
+so here the field paths are parsed once per struct type and reused. Paths
+without list indices are compiled to operator.attrgetter, which walks the
+dotted chain in C.
+"""
+
+import enum
+import functools
+import operator
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import satnogsdecoders.decoder as dec
+
+FieldPaths = Tuple[Tuple[str, Callable[[Any], Any]], ...]
+
+_FIELD_PATHS_CACHE: Dict[type, Optional[FieldPaths]] = {}
+
+
+def _field_paths(struct_type: type) -> Optional[FieldPaths]:
+    """Parse (once) the ``:field name: a.b.c`` entries of a Kaitai class."""
+    try:
+        return _FIELD_PATHS_CACHE[struct_type]
+    except KeyError:
+        pass
+
+    doc_fields = dec.FIELD_REGEX.findall(struct_type.__doc__ or "")
+    if any(dec.UNKNOWN_SIZE_NOTATION in key for key, _ in doc_fields):
+        # Variable-length fields need the library's dynamic key expansion
+        paths = None
+    else:
+        paths = tuple((key, _compile_path(value)) for key, value in doc_fields)
+    _FIELD_PATHS_CACHE[struct_type] = paths
+    return paths
+
+
+def _compile_path(path: str) -> Callable[[Any], Any]:
+    """Build an accessor that resolves a dotted field path like the library."""
+    parts = path.split(".")
+    if any(part.isdigit() for part in parts):
+        # List indexing needs the library's per-step get_attribute()
+        return lambda struct: functools.reduce(dec.get_attribute, parts, struct)
+
+    getter = operator.attrgetter(path)
+
+    def resolve(struct: Any) -> Any:
+        value = getter(struct)
+        return value.name if isinstance(value, enum.Enum) else value
+
+    return resolve
+
+
+def get_fields(struct: Any) -> Dict[str, Any]:
+    """
+    Drop-in replacement for satnogsdecoders.decoder.get_fields(struct).
+
+    Fields whose path does not resolve on this frame are omitted, exactly as
+    the library does with ``empty=False``.
+    """
+    paths = _field_paths(type(struct))
+    if paths is None:
+        return dec.get_fields(struct)
+
+    fields: Dict[str, Any] = {}
+    for key, resolve in paths:
+        try:
+            fields[key] = resolve(struct)
+        except (AttributeError, IndexError):
+            pass
+    return fields
@@ -25,9 +25,9 @@ Unit conversions (raw Kaitai → SI):
 from typing import Dict, Any, Optional
 import math
 
-import satnogsdecoders.decoder as dec
 from satnogsdecoders.decoder.uwe4 import Uwe4
 
+from gr_sat.core.decoders.kaitai import get_fields
 from gr_sat.core.telemetry import (
     BaseDecoder,
     DecoderRegistry,
@@ -36,6 +36,10 @@ from gr_sat.core.telemetry import (
 )
 
 
+# AX.25 stores callsign characters shifted left by one bit
+_CALLSIGN_ROR = bytes(((b >> 1) | ((b & 1) << 7)) for b in range(256))
+
+
 @DecoderRegistry.register(43880)
 class UWE4Decoder(BaseDecoder):
     """
@@ -59,6 +63,10 @@ class UWE4Decoder(BaseDecoder):
         "beacon_payload_panel_pos_z_temp": ("temp_panel_z", 1.0),
         "beacon_payload_uptime": ("uptime", 1.0),
     }
+    # Beacon header bytes 4..9 (fm/to system ids, API, payload size) that make
+    # the Kaitai struct read a housekeeping payload
+    HSKP_BEACON_HEADER = bytes((2, 1, 1, 0, 14, 46))
+    RF_MESSAGE_API = 103
 
     def decode(self, payload: bytes) -> Optional[Dict[str, Any]]:
         return self.decode_with_diagnostics(payload).data
@@ -71,6 +79,15 @@ class UWE4Decoder(BaseDecoder):
         (AX.25 header fields + beacon payload fields). These are written
         to data/interim/ without modification.
         """
+        if self._lacks_housekeeping(payload):
+            return StageOutcome(
+                failure=ProcessingFailure(
+                    stage="decode",
+                    code="missing_required_fields",
+                    message=", ".join(sorted(self.REQUIRED_FIELDS)),
+                )
+            )
+
         try:
             struct = Uwe4.from_bytes(payload)
         except Exception as exc:
@@ -83,7 +100,7 @@ class UWE4Decoder(BaseDecoder):
             )
 
         try:
-            data = dec.get_fields(struct)
+            data = get_fields(struct)
         except Exception as exc:
             return StageOutcome(
                 failure=ProcessingFailure(
@@ -114,6 +131,37 @@ class UWE4Decoder(BaseDecoder):
 
         return StageOutcome(data=data)
 
+    @classmethod
+    def _lacks_housekeeping(cls, payload: bytes) -> bool:
+        """
+        True if the Kaitai struct would parse this frame cleanly but without a
+        housekeeping payload, so it can be rejected without building it.
+
+        Frames that might raise inside the struct (truncated, undecodable
+        callsigns, RF messages) return False and are left to Kaitai, keeping
+        the failure codes identical.
+        """
+        # AX.25 header (16 bytes incl. PID) + beacon header (10 bytes)
+        if len(payload) < 26:
+            return False
+        try:
+            payload[0:6].translate(_CALLSIGN_ROR).decode("utf-8")
+            payload[7:13].translate(_CALLSIGN_ROR).decode("utf-8")
+        except UnicodeDecodeError:
+            return False
+
+        if payload[14] & 0x13 not in (0x03, 0x13):
+            # Not a UI frame: the beacon is never parsed
+            return True
+
+        beacon_header = payload[20:26]
+        if beacon_header == cls.HSKP_BEACON_HEADER:
+            return False
+        return not (
+            beacon_header[:4] == cls.HSKP_BEACON_HEADER[:4]
+            and beacon_header[4] == cls.RF_MESSAGE_API
+        )
+
     def adapt(self, decoded: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         return self.adapt_with_diagnostics(decoded).data
 
@@ -16,6 +16,13 @@ IGNORED_DEDUP_FIELDS = frozenset({"timestamp", "observation_id"})
 
 
 def _normalize_frame_value(value: Any) -> Any:
+    # Fast path for the plain Python scalars that make up most frame fields
+    value_type = type(value)
+    if value is None or value_type is str or value_type is int or value_type is bool:
+        return value
+    if value_type is float:
+        return None if math.isnan(value) else value
+
     if isinstance(value, pd.Timestamp | datetime):
         return pd.Timestamp(value).isoformat()
 
@@ -69,10 +76,10 @@ def deduplicate_processed_frames(
     working = df_processed.copy().reset_index(drop=True)
     working["_row_order"] = working.index
     working["_timestamp_key"] = working["timestamp"].map(_normalize_frame_value)
-    working["_payload_fingerprint"] = working.apply(
-        lambda row: frame_payload_fingerprint(row.to_dict()),
-        axis=1,
-    )
+    # to_dict("records") avoids building a Series per row like apply(axis=1)
+    working["_payload_fingerprint"] = [
+        frame_payload_fingerprint(row) for row in df_processed.to_dict("records")
+    ]
     working["_dedupe_key"] = (
         working["_timestamp_key"].astype(str) + "|" + working["_payload_fingerprint"]
     )
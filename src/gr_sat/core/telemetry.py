@@ -14,7 +14,7 @@ the DecoderRegistry.
 """
 
 from dataclasses import dataclass, fields
-from typing import Dict, Any, Optional, Type
+from typing import ClassVar, Dict, Any, Optional, Type
 from datetime import datetime
 from abc import ABC, abstractmethod
 
@@ -60,7 +60,7 @@ class TelemetryFrame:
 
     def to_dict(self) -> Dict[str, Any]:
         """Returns a flat dictionary suitable for CSV/pandas, excluding internal fields."""
-        return {f.name: getattr(self, f.name) for f in fields(self)}
+        return {name: getattr(self, name) for name in _FRAME_FIELD_NAMES}
 
     @classmethod
     def field_names(cls) -> set:
@@ -68,6 +68,11 @@ class TelemetryFrame:
         return {f.name for f in fields(cls)}
 
 
+# Field order resolved once; fields() rebuilds its tuple on every call
+_FRAME_FIELD_NAMES = tuple(f.name for f in fields(TelemetryFrame))
+_FRAME_FIELDS = frozenset(_FRAME_FIELD_NAMES)
+
+
 @dataclass(frozen=True)
 class ProcessingFailure:
     stage: str
@@ -188,7 +193,9 @@ class DecoderRegistry:
             ...
     """
 
-    _registry: Dict[int, Type[BaseDecoder]] = {}
+    _registry: ClassVar[Dict[int, Type[BaseDecoder]]] = {}
+    # Decoders hold no per-frame state, so one instance per NORAD ID is shared
+    _instances: ClassVar[Dict[int, BaseDecoder]] = {}
 
     @classmethod
     def register(cls, norad_id: int):
@@ -196,6 +203,7 @@ class DecoderRegistry:
 
         def wrapper(decoder_cls: Type[BaseDecoder]):
             cls._registry[norad_id] = decoder_cls
+            cls._instances.pop(norad_id, None)
             logger.debug(
                 f"Registered decoder for NORAD {norad_id}: {decoder_cls.__name__}"
             )
@@ -205,11 +213,15 @@ class DecoderRegistry:
 
     @classmethod
     def get_decoder(cls, norad_id: int) -> Optional[BaseDecoder]:
-        """Returns an instance of the decoder for the given satellite."""
-        decoder_cls = cls._registry.get(int(norad_id))
-        if decoder_cls:
-            return decoder_cls()
-        return None
+        """Returns the (shared) decoder instance for the given satellite."""
+        norad_id = int(norad_id)
+        decoder = cls._instances.get(norad_id)
+        if decoder is None:
+            decoder_cls = cls._registry.get(norad_id)
+            if decoder_cls is None:
+                return None
+            decoder = cls._instances.setdefault(norad_id, decoder_cls())
+        return decoder
 
     @classmethod
     def list_supported(cls) -> Dict[int, str]:
@@ -255,8 +267,9 @@ def process_frame_result(
 
     try:
         # Build TelemetryFrame, only passing fields that exist on the dataclass
-        valid = TelemetryFrame.field_names()
-        filtered = {k: v for k, v in adapted_outcome.data.items() if k in valid}
+        filtered = {
+            k: v for k, v in adapted_outcome.data.items() if k in _FRAME_FIELDS
+        }
 
         return FrameProcessingResult(
             frame=TelemetryFrame(
@@ -131,7 +131,7 @@ def evaluate(norad_id: str, models_dir: Path | str = MODEL_DIR, processed_dir: P
 
     data_path = processed_path / f"{norad_id}.csv"
     df = pd.read_csv(data_path)
-    df["timestamp"] = pd.to_datetime(df["timestamp"])
+    df["timestamp"] = pd.to_datetime(df["timestamp"], format="ISO8601")
     df = df.sort_values("timestamp")
 
     extreme_mask = build_baseline_mask(df, profile)
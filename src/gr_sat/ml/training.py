@@ -155,7 +155,7 @@ def train_for_satellite(
             logger.error(f"Processed data not found at {data_path}")
             return
         df = pd.read_csv(data_path)
-        df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
+        df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True, format="ISO8601")
         df = df.sort_values("timestamp")
 
     orig_len = len(df)
@@ -1,5 +1,10 @@
+from datetime import datetime
+
 import pytest
-from src.api.pass_predictor import predict_passes
+from skyfield.api import EarthSatellite, load, wgs84
+
+from src.api.pass_predictor import _sample_track, predict_passes
+
 
 def test_predict_passes_validation():
     with pytest.raises(ValueError, match="Latitude must be between -90 and 90 degrees"):
@@ -16,3 +21,26 @@ def test_predict_passes_empty_satellites():
     assert result["ground_station"]["label"] == "Test"
     assert result["passes"] == []
     assert result["min_elevation"] == 10.0
+
+def test_sample_track_spans_the_pass():
+    ts = load.timescale()
+    sat = EarthSatellite(
+        "1 25544U 98067A   14020.93268519  .00009878  00000-0  18200-3 0  5082",
+        "2 25544  51.6498 109.4756 0001839  86.6284 273.4947 15.50218315877307",
+        "ISS (ZARYA)",
+        ts,
+    )
+    gs = wgs84.latlon(29.0661, 31.0994, elevation_m=32.0)
+    t, events = sat.find_events(gs, ts.utc(2014, 1, 21), ts.utc(2014, 1, 22))
+    rise = list(events).index(0)
+    t_rise, t_set = t[rise], t[rise + 2]
+
+    track = _sample_track(sat, sat - gs, ts, t_rise, t_set, sample_count=8)
+
+    assert len(track) == 8
+    first = datetime.fromisoformat(track[0]["time"])
+    last = datetime.fromisoformat(track[-1]["time"])
+    assert abs((first - t_rise.utc_datetime()).total_seconds()) < 1e-3
+    assert abs((last - t_set.utc_datetime()).total_seconds()) < 1e-3
+    assert abs(track[0]["elevation"]) <= 0.1
+    assert max(point["elevation"] for point in track) > 0.0
@@ -1,11 +1,57 @@
 import unittest
 from datetime import datetime, timezone
 
+import satnogsdecoders.decoder as dec
+from satnogsdecoders.decoder.uwe4 import Uwe4
+
+from gr_sat.core.decoders.kaitai import get_fields
 from gr_sat.core.decoders.uwe4 import UWE4Decoder
-from gr_sat.core.telemetry import process_frame_result
+from gr_sat.core.telemetry import DecoderRegistry, process_frame_result
+
+# AX.25 UI frame (CQ <- DP0UWH) carrying a housekeeping beacon with dummy values
+UWE4_BEACON = bytes.fromhex(
+    "86a2404040406088a060aaae906103f000000100020101000e2e0a0b0c0d0e0f1011121314"
+    "15161718191a1b1c1d1e1f202122232425262728292a2b2c2d2e2f303132333435363738393a3b"
+)
+# Same frame with an I-frame control byte, and with a non-housekeeping API id.
+# Kaitai parses both cleanly, just without the beacon payload.
+UWE4_I_FRAME = UWE4_BEACON[:14] + b"\x00" + UWE4_BEACON[15:]
+UWE4_WRONG_API = UWE4_BEACON[:24] + b"\x0f" + UWE4_BEACON[25:]
 
 
 class TelemetryDiagnosticsTests(unittest.TestCase):
+    def test_cached_get_fields_matches_satnogs_decoders(self):
+        for frame in (UWE4_BEACON, UWE4_I_FRAME, UWE4_WRONG_API):
+            with self.subTest(frame=frame.hex()):
+                expected = dec.get_fields(Uwe4.from_bytes(frame))
+
+                self.assertEqual(get_fields(Uwe4.from_bytes(frame)), expected)
+                # Second call goes through the per-class path cache
+                self.assertEqual(get_fields(Uwe4.from_bytes(frame)), expected)
+                self.assertEqual(expected["src_callsign"], "DP0UWH")
+
+    def test_decoder_extracts_beacon_fields(self):
+        decoder = UWE4Decoder()
+
+        outcome = decoder.decode_with_diagnostics(UWE4_BEACON)
+
+        self.assertTrue(outcome.ok)
+        self.assertIn("beacon_payload_batt_a_voltage", outcome.data)
+        self.assertIn("beacon_payload_uptime", outcome.data)
+
+    def test_decoder_prefilter_rejects_frames_without_housekeeping(self):
+        decoder = UWE4Decoder()
+
+        for frame in (UWE4_I_FRAME, UWE4_WRONG_API):
+            with self.subTest(frame=frame.hex()):
+                outcome = decoder.decode_with_diagnostics(frame)
+
+                # Same verdict the full Kaitai parse would reach
+                fields = get_fields(Uwe4.from_bytes(frame))
+                self.assertNotIn("beacon_payload_uptime", fields)
+                self.assertFalse(outcome.ok)
+                self.assertEqual(outcome.failure.code, "missing_required_fields")
+
     def test_adapter_preserves_missingness_instead_of_coercing_to_zero(self):
         decoder = UWE4Decoder()
 
@@ -52,6 +98,12 @@ class TelemetryDiagnosticsTests(unittest.TestCase):
         self.assertFalse(outcome.ok)
         self.assertEqual(outcome.failure.code, "invalid_numeric_value")
 
+    def test_registry_reuses_decoder_instance_per_norad_id(self):
+        decoder = DecoderRegistry.get_decoder(43880)
+
+        self.assertIsInstance(decoder, UWE4Decoder)
+        self.assertIs(DecoderRegistry.get_decoder("43880"), decoder)
+
     def test_process_frame_result_reports_missing_decoder(self):
         result = process_frame_result(
             norad_id=99999,